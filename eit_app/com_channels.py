@@ -44,7 +44,7 @@ class Obj2Class(SignalReciever)
 
 from abc import ABC
 from dataclasses import dataclass, field
-from queue import Queue
+from queue import Empty, SimpleQueue
 from typing import Any, Callable
 
 from glob_utils.thread_process.signal import Signal
@@ -52,7 +52,7 @@ from glob_utils.thread_process.signal import Signal
 from glob_utils.thread_process.threads_worker import CustomWorker
 import numpy as np
 from eit_app.sciospec.setup import SciospecSetup
-from eit_app.update_gui import UPDATE_EVENTS, EventDataClass, UpdateAgent
+from eit_app.update_gui import EventDataClass, UpdateAgent
 from eit_app.sciospec.voltage import EITChannelVoltage
 
 class SignalDataClass(ABC):
@@ -342,7 +342,7 @@ class SignalReciever(object):
 #         super().__init__()
 #         self.init_reciever(data_callbacks={EventDataClass: self.update_gui})
 #         self._data_buffer = Queue(maxsize=2048)  # TODO maybe
-#         self._update_agent = UpdateAgent(self, UPDATE_EVENTS)
+#         self._update_agent = UpdateAgent(self)
 #         self._worker = CustomWorker(name="update_gui", sleeptime=0.01)
 #         self._worker.progress.connect(self._process_data_for_update)
 #         self._worker.start()
@@ -381,7 +381,8 @@ class AddUpdateUiAgent(SignalReciever):
         updating the gui"""
         super().__init__()
         self.init_reciever(data_callbacks={EventDataClass: self.update_gui})
-        self._data_buffer = Queue(maxsize=2048)  # TODO maybe
+        # producers (any thread) never block on put
+        self._data_buffer = SimpleQueue()
         self._update_agent = None
         self._worker = CustomWorker(name="update_gui", sleeptime=0.01)
         self._worker.progress.connect(self._process_data_for_update)
@@ -389,7 +390,7 @@ class AddUpdateUiAgent(SignalReciever):
         self._worker.start_polling()
 
     def init_update_ui_agent(self, ui):
-        self._update_agent = UpdateAgent(ui, UPDATE_EVENTS)
+        self._update_agent = UpdateAgent(ui)
 
     def update_gui(self, data: EventDataClass = None, **kwargs):
         """Add data in input buffer
@@ -401,12 +402,36 @@ class AddUpdateUiAgent(SignalReciever):
             self._data_buffer.put(data)
 
     def _process_data_for_update(self) -> None:
-        """Retrieve EventDataClass out of the input buffer and post them via
-        UpdateAgent.
+        """Retrieve all EventDataClass out of the input buffer and post them
+        via UpdateAgent.
+
+        Event data with the same coalescing key (see
+        `EventDataClass.coalesce_key`) are only posted once, at the place of
+        the last one recieved.
         """
         # self.handle_meas_status_change() # here for the momenet but optimal
-        if self._data_buffer.empty() or self._update_agent is None:
+        if self._update_agent is None:
+            return
+        batch = []
+        # only the data present at the start are retrieved, so that the gui
+        # thread is not hold if new data are continuously added
+        for _ in range(self._data_buffer.qsize()):
+            try:
+                batch.append(self._data_buffer.get_nowait())
+            except Empty:
+                break
+        if not batch:
             return
-        data = self._data_buffer.get(block=True)
-        # logger.debug(f'_process_data_for_update Update {data}')
-        self._update_agent.post(data)
+
+        last = {}
+        for data in batch:
+            key = data.coalesce_key()
+            if key is not None:
+                last[(type(data), key)] = data
+
+        for data in batch:
+            key = data.coalesce_key()
+            if key is not None and last[(type(data), key)] is not data:
+                continue
+            # logger.debug(f'_process_data_for_update Update {data}')
+            self._update_agent.post(data)
@@ -40,6 +40,7 @@ class ComputingAgent(SignalReciever, AddToPlotSignal, AddToGuiSignal):
         self.init_reciever(data_callbacks={Data2Compute: self.add_data2compute})
 
         self.input_buf = Queue()
+        self.init_buf = Queue()
         self.compute_worker = Poller(
             name="compute", pollfunc=self._poll_input_buf, sleeptime=0.01
         )
@@ -66,6 +67,13 @@ class ComputingAgent(SignalReciever, AddToPlotSignal, AddToGuiSignal):
         multiple data has been added. it doesn't make sense to compute all of
         then if computation take so much time
         """
+        # pending solver initialization are run first, in this thread
+        if not self.init_buf.empty():
+            # only the last initialization requested is relevant
+            while not self.init_buf.empty():
+                solver, params = self.init_buf.get()
+            self._init_solver(solver, params)
+
         if self.input_buf.empty():
             return
         # process only the last data added, ignore the rest
@@ -73,8 +81,17 @@ class ComputingAgent(SignalReciever, AddToPlotSignal, AddToGuiSignal):
             data = self.input_buf.get()
         self.process(data)
 
-    @catch_error
     def init_solver(self, solver: Solver, params: Any) -> None:
+        """Request the initialization of internal solver, optionaly new solver
+        or reconstruction parameters can be set before.
+
+        The initialization (which can take some time) is run in the compute
+        thread and not in the calling one (e.g. the GUI thread)
+        """
+        self.init_buf.put((solver, params))
+
+    @catch_error
+    def _init_solver(self, solver: Solver, params: Any) -> None:
         """Initialize internal solver, optionaly new solver or reconstruction
         parameters can be set before
         """
@@ -1,7 +1,15 @@
+from contextlib import contextmanager
 import itertools
 from dataclasses import dataclass
 from typing import Any, Callable, List
-from PyQt5.QtWidgets import QComboBox, QTableWidgetItem, QTableWidget, QSlider
+from PyQt5.QtCore import QSignalBlocker, QStringListModel
+from PyQt5.QtWidgets import (
+    QComboBox,
+    QSlider,
+    QTableWidget,
+    QTableWidgetItem,
+    QWidget,
+)
 import numpy as np
 import logging
 
@@ -82,15 +90,16 @@ def set_QTableWidget(
     if np.prod(mat.shape) > 1:
         numrows = len(mat)  # 6 rows in your example
         numcols = len(mat[0])  # 3 columns in your example
-        table.setColumnCount(numcols)  # Set colums and rows in QTableWidget
-        table.setRowCount(numrows)
-        for row, column in itertools.product(range(numrows), range(numcols)):
-            val = f"{mat[row][column]:.{decimal}f}"
-            table.setItem(
-                row,
-                column,
-                QTableWidgetItem(val),
-            )
+        with updates_disabled(table):
+            table.setColumnCount(numcols)  # Set colums and rows in QTableWidget
+            table.setRowCount(numrows)
+            for row, column in itertools.product(range(numrows), range(numcols)):
+                val = f"{mat[row][column]:.{decimal}f}"
+                table.setItem(
+                    row,
+                    column,
+                    QTableWidgetItem(val),
+                )
     else:
         table.clearContents()
 
@@ -133,6 +142,28 @@ def set_comboBox_items(
     comboBox.blockSignals(False)
 
 
+def set_comboBox_strings(
+    comboBox: QComboBox, items: list[str], init_index: int = 0
+) -> None:
+    """Set (all at once) the items of a comboBox via a QStringListModel, for
+    long lists it avoids the insertion of each item one by one. The signals
+    of the comboBox are blocked during the setting.
+
+    Args:
+        comboBox (QComboBox): comboBox to set
+        items (list[str]): new items list to set
+        init_index (int, optional): set default item index . Defaults to 0.
+    """
+    comboBox.blockSignals(True)
+    model = comboBox.model()
+    if isinstance(model, QStringListModel):
+        model.setStringList(items)
+    else:
+        comboBox.setModel(QStringListModel(items, comboBox))
+    set_comboBox_index(comboBox, init_index)
+    comboBox.blockSignals(False)
+
+
 def get_comboBox_allItemsText(comboBox: QComboBox) -> list[str]:
     """Set the actual item index of a comboBox/DropdownMenu
 
@@ -175,15 +206,16 @@ def set_QTableWidget(
     if np.prod(mat.shape) > 1:
         numrows = len(mat)  # 6 rows in your example
         numcols = len(mat[0])  # 3 columns in your example
-        table.setColumnCount(numcols)  # Set colums and rows in QTableWidget
-        table.setRowCount(numrows)
-        for row, column in itertools.product(range(numrows), range(numcols)):
-            val = f"{mat[row][column]:.{decimal}f}"
-            table.setItem(
-                row,
-                column,
-                QTableWidgetItem(val),
-            )
+        with updates_disabled(table):
+            table.setColumnCount(numcols)  # Set colums and rows in QTableWidget
+            table.setRowCount(numrows)
+            for row, column in itertools.product(range(numrows), range(numcols)):
+                val = f"{mat[row][column]:.{decimal}f}"
+                table.setItem(
+                    row,
+                    column,
+                    QTableWidgetItem(val),
+                )
     else:
         table.clearContents()
 
@@ -254,10 +286,43 @@ def block_signals(method: Callable, *args, **kwargs):
     Args:
         method (Callable): Method to run
     """
-    obj = method.__self__
-    obj.blockSignals(True)
-    method(*args, **kwargs)
-    obj.blockSignals(False)
+    with QSignalBlocker(method.__self__):
+        method(*args, **kwargs)
+
+
+@contextmanager
+def updates_disabled(widget: QWidget):
+    """Disable the updates (repaint) of a widget and its children during the
+    execution of the context, the widget is repainted once at the end
+    (also if an exception is raised)
+
+    Args:
+        widget (QWidget): widget to freeze
+    """
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def set_if_changed(getter: Callable, setter: Callable, val: Any, block: bool = False):
+    """Run the setter of a QtObject only if the value returned by its getter
+    differs from the value to set (avoid unneeded restyle/repaint of widgets)
+
+    Args:
+        getter (Callable): getter method of the QtObject (e.g. lineEdit.text)
+        setter (Callable): setter method of the QtObject (e.g. lineEdit.setText)
+        val (Any): value to set
+        block (bool, optional): block signals emitted by the QtObject during
+        the setting. Defaults to `False`.
+    """
+    if getter() == val:
+        return
+    if block:
+        block_signals(setter, val)
+    else:
+        setter(val)
 
 
 if __name__ == "__main__":
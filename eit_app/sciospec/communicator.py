@@ -1,16 +1,19 @@
+from collections import deque
+import contextlib
 from dataclasses import dataclass
 from enum import Enum
 import logging
-from queue import Queue
-from time import sleep
+import threading
+from typing import Union
 from eit_app.sciospec.constants import (
+    ACK_BY_BYTE,
     ACK_FRAME,
     CMD_BYTE_INDX,
     SUCCESS,
     CMD_START_STOP_MEAS,
+    LENGTH_BYTE_INDX,
     NONE_ACK,
     OPTION_BYTE_INDX,
-    SCIOSPEC_ACK,
     Answer,
     SciospecAck,
     SciospecCmd,
@@ -21,7 +24,6 @@ from eit_app.sciospec.constants import (
 )
 from eit_app.sciospec.interface import Interface
 from glob_utils.flags.flag import CustomFlag
-from glob_utils.flags.timer import CustomTimer
 from glob_utils.directory.utils import get_datetime_s
 from glob_utils.thread_process.buffer import BufferList
 from glob_utils.thread_process.signal import Signal
@@ -29,6 +31,9 @@ from glob_utils.thread_process.threads_worker import Poller
 
 logger = logging.getLogger(__name__)
 
+CMD_TIMEOUT = 5.0  # max time to wait for the ack of all commands send, in s
+PROBE_TIMEOUT = 0.25  # max time to wait for the ack of a port probe, in s
+
 
 class CommunicatorError(Exception):
     """"""
@@ -94,15 +99,22 @@ class SciospecCommunicator:  # TODO >> AddStatus
 
     def __init__(self) -> None:
         """Constructor"""
-        self.rx_frame = Queue(maxsize=2048)
+        # single producer (interface listener), single consumer (processor),
+        # append/popleft of a deque are thread-safe without extra lock
+        self.rx_frames = deque()
         self.processor = Poller(
             name="process_rx_frame",
-            pollfunc=self._process_last_rx_frame,
+            pollfunc=self._process_rx_frames,
             sleeptime=0.01,
         )
         self.processor.start()
         self.processor.start_polling()
-        self.timer_busy = CustomTimer(5.0, 1)  # max 5s timeout! #TODO >> Timer??
+        # set when all ack of the send commands have been recieved
+        self._idle = threading.Event()
+        self._idle.set()
+        # the commands history and the idle event are changed together, so
+        # that a command registered by another thread is never seen as idle
+        self._hist_lock = threading.Lock()
 
         self.cmd_op_hist = BufferList()
         self.resp_hist = BufferList()
@@ -114,23 +126,65 @@ class SciospecCommunicator:  # TODO >> AddStatus
         self.process_meas_enabled = CustomFlag()
         self.process_meas_enabled.clear()
 
+        # prebuilt frames of the commands without data, key: (cmd.tag, op.tag)
+        self.static_frames: dict[tuple[int, int], bytes] = {}
+
     def reinit(self) -> None:
         """Reinit the communicator"""
-        self.status = StatusCommunicator.IDLE
-        self.cmd_op_hist.clear()
-        self.resp_hist.clear()
+        with self._hist_lock:
+            self.status = StatusCommunicator.IDLE
+            self.cmd_op_hist.clear()
+            self.resp_hist.clear()
+            self._idle.set()
 
-    def wait_not_busy(self) -> None:
-        """Wait until the Communicator get all ack fro all commands send"""
-        self.timer_busy.reset()
-        while self.is_waiting():
-            logger.debug(
-                f"waiting for device {self.timer_busy.cnt}/{self.timer_busy.max_cnt}"
-            )
-            if self.timer_busy.increment():
-                logger.error("Waiting device - Timeout")
-                self.reinit()
-            sleep(1)
+    def wait_not_busy(
+        self, timeout: float = CMD_TIMEOUT, log_timeout: bool = True
+    ) -> bool:
+        """Wait until the Communicator get all ack fro all commands send
+
+        Args:
+            timeout (float, optional): max waiting time in s, after it the
+            communicator is reinitializated. Defaults to CMD_TIMEOUT.
+            log_timeout (bool, optional): set to `False` if a timeout is
+            expected (e.g. pinging a device), it is then not logged as
+            error. Defaults to `True`.
+
+        Returns:
+            bool: `True` if all ack have been recieved, `False` on timeout
+        """
+        if self._idle.wait(timeout):
+            return True
+        if log_timeout:
+            logger.error("Waiting device - Timeout")
+        self.reinit()
+        return False
+
+    def set_static_frames(
+        self, cmd_ops: list[tuple[SciospecCmd, SciospecOption]]
+    ) -> None:
+        """Build once the frames of commands without data (e.g. start/stop
+        meas, get cmds), they are then reused for each sending
+
+        Args:
+            cmd_ops (list[tuple[SciospecCmd, SciospecOption]]): commands and
+            options of the static frames
+        """
+        self.static_frames = {
+            (cmd.tag, op.tag): bytes(build_cmd_frame(cmd, op, []))
+            for cmd, op in cmd_ops
+        }
+
+    def is_static(self, cmd: SciospecCmd, op: SciospecOption) -> bool:
+        """Return if the frame of the command/option is prebuilt"""
+        return (cmd.tag, op.tag) in self.static_frames
+
+    def _build_tx_frame(
+        self, cmd: SciospecCmd, op: SciospecOption, data: list[bytes]
+    ) -> Union[list[bytes], bytes]:
+        """Return the prebuilt frame of the command/option if available,
+        otherwise build it"""
+        tx_frame = self.static_frames.get((cmd.tag, op.tag))
+        return build_cmd_frame(cmd, op, data) if tx_frame is None else tx_frame
 
     def processing_meas_enable(self, cmd: SciospecCmd, op: SciospecOption):
         """Activate or deactivate the processing of measuremnet frame"""
@@ -158,15 +212,70 @@ class SciospecCommunicator:  # TODO >> AddStatus
 
         # TODO activate listening!
         self.processing_meas_enable(cmd, op)
-        tx_frame = build_cmd_frame(cmd, op, data)
+        tx_frame = self._build_tx_frame(cmd, op, data)
 
         tx_cmd = TxCmdOpData(cmd, op, tx_frame, get_datetime_s())
+        # the cmd is registered before writing, as the ack can come before
+        # the end of the write
+        with self._hist_lock:
+            self._idle.clear()
+            self.cmd_op_hist.add(tx_cmd)
+            self.status = StatusCommunicator.WAIT_FOR_DEVICE
         success = interface.write(tx_frame)
         # s='SUCCESS' if success else "ERROR"
-        if success:
-            self.cmd_op_hist.add(tx_cmd)
+        if not success:
+            # nothing was sent, the cmd will not be acknowledged (the history
+            # can already be cleared by a reinit from the interface error)
+            with self._hist_lock, contextlib.suppress(ValueError):
+                self.cmd_op_hist.buffer.remove(tx_cmd)
+            self._update_status()
+        logger.debug("%s - %s", tx_cmd.info_long, SUCCESS[success])
+        return success
+
+    def send_cmd_frames(
+        self,
+        interface: Interface,
+        cmds: list[tuple[SciospecCmd, SciospecOption, list[bytes]]],
+    ) -> bool:
+        """Send several command frames to the device in a single write
+        - build all the cmd frames
+        - add all the cmds and ops in the history
+        - write all the cmd_frames at once to the interface
+
+        The device process the commands in order, so the acks are
+        attributed to the commands in the history as for single command.
+
+        Args:
+            interface (Interface): interface to write to
+            cmds (list[tuple[SciospecCmd, SciospecOption, list[bytes]]]):
+            commands, options and data of the cmd frames to send
+
+        Returns:
+            bool: `True` if the write was successful
+        """
+        tx_cmds = []
+        tx_frames = []
+        for cmd, op, data in cmds:
+            self.processing_meas_enable(cmd, op)
+            tx_frame = self._build_tx_frame(cmd, op, data)
+            tx_cmds.append(TxCmdOpData(cmd, op, tx_frame, get_datetime_s()))
+            tx_frames.extend(tx_frame)
+        if not tx_cmds:
+            return True
+
+        # the cmds are registered before writing, as the first acks can come
+        # before the end of the write
+        with self._hist_lock:
+            self._idle.clear()
+            for tx_cmd in tx_cmds:
+                self.cmd_op_hist.add(tx_cmd)
             self.status = StatusCommunicator.WAIT_FOR_DEVICE
-        logger.debug(f"{tx_cmd.info_long} - {SUCCESS[success]}")
+        success = interface.write(tx_frames)
+        if not success:
+            # the cmds which could have been recieved by the device are unknown
+            self.reinit()
+        for tx_cmd in tx_cmds:
+            logger.debug("%s - %s", tx_cmd.info_long, SUCCESS[success])
         return success
 
     ## =========================================================================
@@ -175,16 +284,19 @@ class SciospecCommunicator:  # TODO >> AddStatus
 
     def add_rx_frame(self, rx_frame: list[bytes], **kwargs) -> None:
         """Add a recieved frame in the queue to be treated"""
-        logger.debug(f"RX_Frame added to process: {rx_frame[:10]}")
-        self.rx_frame.put_nowait(rx_frame)
+        logger.debug("RX_Frame added to process: %s", rx_frame[:10])
+        self.rx_frames.append(rx_frame)
 
     # @catch_error
-    def _process_last_rx_frame(self) -> None:
-        """Method polled by the processor to process all rx_frames one by one"""
-        if self.rx_frame.empty():
-            return
-        rx_frame = self.rx_frame.get_nowait()
-        self._process_rx_frame(rx_frame)
+    def _process_rx_frames(self) -> None:
+        """Method polled by the processor to process all rx_frames one by one
+
+        Only the frames present at the start are processed, so that the
+        processor is not hold if new frames are continuously added
+        """
+        rx_frames = self.rx_frames
+        for _ in range(len(rx_frames)):
+            self._process_rx_frame(rx_frames.popleft())
 
     def _process_rx_frame(self, rx_frame: list[bytes]) -> None:
         """Sort the recieved frames between ACKNOWLEGMENT, MEASURING, RESPONSE
@@ -204,10 +316,14 @@ class SciospecCommunicator:  # TODO >> AddStatus
         return rx_frame
 
     def _is_ack(self, rx_frame: list[bytes]) -> bool:
-        """Return if rx_frame is an ACKNOWLEGMENT frame"""
-        tmp = rx_frame[:]
-        tmp[OPTION_BYTE_INDX] = 0
-        return tmp == ACK_FRAME
+        """Return if rx_frame is an ACKNOWLEGMENT frame (equal to ACK_FRAME
+        except the option byte)"""
+        return (
+            len(rx_frame) == len(ACK_FRAME)
+            and rx_frame[CMD_BYTE_INDX] == ACK_FRAME[CMD_BYTE_INDX]
+            and rx_frame[LENGTH_BYTE_INDX] == ACK_FRAME[LENGTH_BYTE_INDX]
+            and rx_frame[-1] == ACK_FRAME[-1]
+        )
 
     def _is_meas(self, rx_frame: list[bytes]) -> bool:
         """Return if rx_frame is a MEASURING frame"""
@@ -228,25 +344,21 @@ class SciospecCommunicator:  # TODO >> AddStatus
         """Treat the recieved MEASURING frame
         - process of the frame"""
         if self.process_meas_enabled.is_set():
-            logger.debug(f"RX_MEAS: {rx_frame[:10]}")
+            logger.debug("RX_MEAS: %s", rx_frame[:10])
             self._emit_rx_frame(rx_frame)
 
     def _process_rx_resp(self, rx_frame: list[bytes]) -> None:
         """Treat the recieved RESPONSE frame
         - add the response to the history (it will be treated after ack)"""
         resp = RxRespData(rx_frame, get_datetime_s())
-        logger.debug(f"{resp.info}")
+        logger.debug("%s", resp.info)
         self.resp_hist.add(resp)
 
     def _identify_ack(self, rx_frame: list[bytes]) -> SciospecAck:
         """return the corresponding SciospecAck object
         if not found in the list "ACKs", return "NONE_ACK""" ""
-        rx_ack = NONE_ACK
-        for ack_i in SCIOSPEC_ACK:
-            if ack_i.ack_byte == rx_frame[OPTION_BYTE_INDX]:
-                rx_ack = ack_i
-                break
-        logger.debug(f"RX_ACK: {rx_ack.name}, {rx_frame}")
+        rx_ack = ACK_BY_BYTE.get(rx_frame[OPTION_BYTE_INDX], NONE_ACK)
+        logger.debug("RX_ACK: %s, %s", rx_ack.name, rx_frame)
         return rx_ack
 
     def _handle_nack(self, rx_ack: SciospecAck) -> None:
@@ -262,12 +374,15 @@ class SciospecCommunicator:  # TODO >> AddStatus
         - process them
         """
         # logger.debug(f"{self.cmd_op_hist.buffer}")
-        if self.cmd_op_hist.is_empty():
-            logger.debug(f"No CMD registered: {rx_ack.name} - IGNORED")
+        with self._hist_lock:
+            if not self.cmd_op_hist.is_empty():
+                tx_cmd: TxCmdOpData = self.cmd_op_hist.pop_oldest()
+            else:
+                tx_cmd = None
+        if tx_cmd is None:
+            logger.debug("No CMD registered: %s - IGNORED", rx_ack.name)
             return
 
-        tx_cmd: TxCmdOpData = self.cmd_op_hist.pop_oldest()
-
         if tx_cmd.wait_ans_and_ack():
             if self.resp_hist.is_empty():
                 logger.debug(
@@ -275,13 +390,14 @@ class SciospecCommunicator:  # TODO >> AddStatus
                 )
                 return
             rx_resp: RxRespData = self.resp_hist.pop_oldest()
-            msg = f"{rx_ack.name} of:\r\n{tx_cmd.info}\r\n{rx_resp.info} - SUCCESS"
+            logger.debug(
+                "%s of:\r\n%s\r\n%s - SUCCESS", rx_ack.name, tx_cmd.info, rx_resp.info
+            )
             self._emit_rx_frame(rx_resp.rx_frame)
 
         elif tx_cmd.wait_ack_only():
-            msg = f"{rx_ack.name} of:\r\n{tx_cmd.info} - SUCCESS"
+            logger.debug("%s of:\r\n%s - SUCCESS", rx_ack.name, tx_cmd.info)
 
-        logger.debug(msg)
         self._update_status()
 
     def _emit_rx_frame(self, rx_frame: list[bytes]):
@@ -293,18 +409,19 @@ class SciospecCommunicator:  # TODO >> AddStatus
         cmd_tag = rx_frame[CMD_BYTE_INDX]
 
         if cmd_tag == CMD_START_STOP_MEAS.tag:  # a measurement frame
-            kwargs = {"rx_meas_stream": rx_frame}
-            logger.debug(f"RX_MEAS: {rx_frame[:10]} -  EMITTED")
-            self.new_rx_meas_stream.emit(**kwargs)
+            logger.debug("RX_MEAS: %s -  EMITTED", rx_frame[:10])
+            self.new_rx_meas_stream.emit(rx_meas_stream=rx_frame)
         else:  # a setup frame
-            kwargs = {"rx_setup_stream": rx_frame}
-            logger.debug(f"RX_RESPONSE: {rx_frame[:10]} -  EMITTED")
-            self.new_rx_setup_stream.emit(**kwargs)
+            logger.debug("RX_RESPONSE: %s -  EMITTED", rx_frame[:10])
+            # the setup stores parts of the frame (sn, ip, patterns...) as list
+            self.new_rx_setup_stream.emit(rx_setup_stream=list(rx_frame))
 
     def _update_status(self):
         """Change the status to the commands history and c"""
-        if self.cmd_op_hist.is_empty():
-            self.status = StatusCommunicator.IDLE
+        with self._hist_lock:
+            if self.cmd_op_hist.is_empty():
+                self.status = StatusCommunicator.IDLE
+                self._idle.set()
 
     def is_waiting(self):
         """Asset if the comunicator is waiting for the device"""
@@ -343,7 +343,9 @@ def get_op(ops: list[SciospecOption], tag) -> SciospecOption:
 def build_cmd_frame(cmd: SciospecCmd, op: SciospecOption, data: list[bytes]):
     """Make the command frame to send according to the cmd, op and data"""
 
-    if op not in cmd.options:
+    # options are module constants, compared by identity (dataclass equality
+    # would compare all their fields)
+    if all(op is not cmd_op for cmd_op in cmd.options):
         raise TypeError(
             f'Command "{cmd.name}" ({cmd.tag}) not compatible with option "{op.name}"({op.tag})'
         )
@@ -362,12 +364,37 @@ def build_cmd_frame(cmd: SciospecCmd, op: SciospecOption, data: list[bytes]):
         else:
             if len(data) + 1 != LL_byte:
                 raise TypeError("Data do not have right lenght")
-            cmd_frame = [cmd.tag, LL_byte, op.tag]
-            cmd_frame.extend(iter(data))
-            cmd_frame.append(cmd.tag)
+            cmd_frame = [cmd.tag, LL_byte, op.tag, *data, cmd.tag]
     return cmd_frame
 
 
+def slice_rx_frames(buf: bytearray) -> list[bytes]:
+    """Slice the complete frames out of a buffer of recieved bytes
+
+    The complete frames are removed from the buffer, the bytes of an
+    incomplete frame stay in it (to be completed by the next recieved bytes)
+
+    Args:
+        buf (bytearray): buffer of recieved bytes, modified in place
+
+    Returns:
+        list[bytes]: complete frames, each copied once out of the buffer
+    """
+    rx_frames = []
+    start = 0
+    # a frame is at least 4 bytes: CMD, length (LL), (data...), CMD
+    while len(buf) - start >= FRAME_LENGTH_MIN:
+        # length of data + header up to the length byte + ending CMD Byte
+        end = start + buf[start + LENGTH_BYTE_INDX] + LENGTH_BYTE_INDX + 2
+        if end > len(buf):
+            break
+        rx_frames.append(bytes(buf[start:end]))
+        start = end
+    if start:
+        del buf[:start]
+    return rx_frames
+
+
 ################################################################################
 ##  Class of acknoledgments of the Sciospec device##############################
 ################################################################################
@@ -434,6 +461,9 @@ SCIOSPEC_ACK = [
 
 ACK_FRAME = [0x18, 0x01, 0x00, 0x18]
 
+# SciospecAck by ack_byte, for a direct identification of the recieved ack
+ACK_BY_BYTE = {ack.ack_byte: ack for ack in SCIOSPEC_ACK}
+
 
 if __name__ == "__main__":
     """ """
@@ -1,7 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 import logging
-from time import sleep
-from typing import Any, Union
+from time import monotonic, sleep
+from typing import Any, Iterable, Union
 
 from eit_app.sciospec.constants import (
     CMD_GET_DEVICE_INFOS,
@@ -32,7 +33,7 @@ from eit_app.sciospec.constants import (
     SciospecCmd,
     SciospecOption,
 )
-from eit_app.sciospec.communicator import SciospecCommunicator
+from eit_app.sciospec.communicator import PROBE_TIMEOUT, SciospecCommunicator
 from eit_app.sciospec.interface import SciospecSerialInterface
 from eit_app.sciospec.measurement import (
     DataAddRxMeasStream,
@@ -71,6 +72,17 @@ from serial import (  # get from http://pyserial.sourceforge.net/
 logger = logging.getLogger(__name__)
 
 NONE_DEVICE = "None Device"
+RESET_TIMEOUT = 10.0  # max time for the device to restart after a reset, in s
+
+# commands sent without data, their frames are built once (see __init__)
+# the commands of SciospecEITDevice.GET_SETUP_SEQ are also without data
+STATIC_CMD_OPS = [
+    (CMD_START_STOP_MEAS, OP_START_MEAS),
+    (CMD_START_STOP_MEAS, OP_STOP_MEAS),
+    (CMD_SOFT_RESET, OP_NULL),
+    (CMD_GET_DEVICE_INFOS, OP_NULL),
+    (CMD_SET_MEAS_SETUP, OP_RESET_SETUP),
+]
 
 
 ################################################################################
@@ -104,9 +116,41 @@ class SciospecEITDevice(
     # two different Signals new_rx_meas_stream/new_rx_setup_stream
     communicator: SciospecCommunicator
 
+    # commands/options sent in that order to set the setup to the device
+    # (followed by the excitation patterns)
+    SET_SETUP_SEQ = (
+        (CMD_SET_OUTPUT_CONFIG, OP_EXC_STAMP),
+        (CMD_SET_OUTPUT_CONFIG, OP_CURRENT_STAMP),
+        (CMD_SET_OUTPUT_CONFIG, OP_TIME_STAMP),
+        (CMD_SET_ETHERNET_CONFIG, OP_DHCP),
+        (CMD_SET_MEAS_SETUP, OP_RESET_SETUP),
+        (CMD_SET_MEAS_SETUP, OP_EXC_AMPLITUDE),
+        (CMD_SET_MEAS_SETUP, OP_BURST_COUNT),
+        (CMD_SET_MEAS_SETUP, OP_FRAME_RATE),
+        (CMD_SET_MEAS_SETUP, OP_EXC_FREQUENCIES),
+    )
+    # commands/options sent in that order to get the setup of the device
+    GET_SETUP_SEQ = (
+        (CMD_GET_MEAS_SETUP, OP_EXC_AMPLITUDE),
+        (CMD_GET_MEAS_SETUP, OP_BURST_COUNT),
+        (CMD_GET_MEAS_SETUP, OP_FRAME_RATE),
+        (CMD_GET_MEAS_SETUP, OP_EXC_FREQUENCIES),
+        (CMD_GET_MEAS_SETUP, OP_EXC_PATTERN),
+        (CMD_GET_OUTPUT_CONFIG, OP_EXC_STAMP),
+        (CMD_GET_OUTPUT_CONFIG, OP_CURRENT_STAMP),
+        (CMD_GET_OUTPUT_CONFIG, OP_TIME_STAMP),
+        (CMD_GET_ETHERNET_CONFIG, OP_IP_ADRESS),
+        (CMD_GET_ETHERNET_CONFIG, OP_MAC_ADRESS),
+        (CMD_GET_ETHERNET_CONFIG, OP_DHCP),
+    )
+
     def __init__(self, n_channel: int = 32):
         super().__init__()
 
+        # actual status also hold here for the frequent checks, see set_status
+        self._meas_status = MeasuringStatus.NOT_MEASURING
+        # nb of frames to measure (0: endless), only set while measuring
+        self._burst_target = 0
         self.init_status(status_values=MeasuringStatus)
         self.init_reciever(
             data_callbacks={
@@ -120,10 +164,17 @@ class SciospecEITDevice(
         self.setup = SciospecSetup(self.n_channel)
         self.serial_interface = SciospecSerialInterface()
         self.communicator = SciospecCommunicator()
+        self.communicator.set_static_frames(STATIC_CMD_OPS + list(self.GET_SETUP_SEQ))
 
         # all the errors from the interface are catch and send through this
         # error signal, the error are then here handled. Some of then need
         # action on the device itself
+        # handlers by error type, PortNotOpenError first as it is a
+        # subclass of SerialException (see _handle_interface_error)
+        self._error_handlers = {
+            PortNotOpenError: self._handle_port_not_open_error,
+            SerialException: self._handle_serial_error,
+        }
         self.serial_interface.error.connect(self._handle_interface_error)
         # send the new to be processed by the communicator
         self.serial_interface.new_rx_frame.connect(self.communicator.add_rx_frame)
@@ -142,17 +193,27 @@ class SciospecEITDevice(
         meas_status_dev = self.is_measuring or self.is_paused
         self.to_capture.emit(SetStatusWMeasStatus(meas_status_dev))
 
+    def set_status(self, status: MeasuringStatus) -> None:
+        """Set the measuring status (see AddStatus)
+
+        The status is also kept as plain attribute, so that `is_measuring`,
+        `is_paused`, `is_idle` (used by `check_not_measuring` before most of
+        the device methods) are simple comparisons
+        """
+        self._meas_status = status
+        super().set_status(status)
+
     @property
     def is_measuring(self) -> bool:
-        return self.is_status(MeasuringStatus.MEASURING)
+        return self._meas_status is MeasuringStatus.MEASURING
 
     @property
     def is_paused(self) -> bool:
-        return self.is_status(MeasuringStatus.PAUSED)
+        return self._meas_status is MeasuringStatus.PAUSED
 
     @property
     def is_idle(self) -> bool:
-        return self.is_status(MeasuringStatus.NOT_MEASURING)
+        return self._meas_status is MeasuringStatus.NOT_MEASURING
 
     ## =========================================================================
     ##  Methods to update gui
@@ -167,23 +228,36 @@ class SciospecEITDevice(
     ## =========================================================================
     ##  Methods for dataset
     ## =========================================================================
-    def emit_new_rx_meas_stream(self, **kwargs):
+    def emit_new_rx_meas_stream(self, rx_meas_stream: list[bytes], **kwargs):
         """send the new rx measuremenst stream to be added in the dataset"""
-        self.to_dataset.emit(DataAddRxMeasStream(kwargs["rx_meas_stream"]))
+        self.to_dataset.emit(DataAddRxMeasStream(rx_meas_stream))
 
     ## =========================================================================
     ##  methods for interface
     ## =========================================================================
     def _handle_interface_error(self, error, **kwargs):
         """Manage the error from the interface, """
-        if isinstance(error, PortNotOpenError):
-            logger.warning(f"None devices available\n{error.__str__()}")
-            self.to_gui.emit(EvtPopMsgBox("None devices available", f"{error.__str__()}", 'warn'))
-        elif isinstance(error, SerialException):
-            logger.warning(f"Device not detected\n{error.__str__()}")
-            self.to_gui.emit(EvtPopMsgBox("Device not detected", f"{error.__str__()}", 'warn'))
-            self.disconnect_device()
-            self.get_devices()
+        handler = self._error_handlers.get(type(error))
+        if handler is None:
+            # subclasses of the handled errors, the handler found is cached
+            handler = next(
+                (h for cls, h in self._error_handlers.items() if isinstance(error, cls)),
+                None,
+            )
+            if handler is None:
+                return
+            self._error_handlers[type(error)] = handler
+        handler(error)
+
+    def _handle_port_not_open_error(self, error: PortNotOpenError):
+        logger.warning(f"None devices available\n{error.__str__()}")
+        self.to_gui.emit(EvtPopMsgBox("None devices available", f"{error.__str__()}", 'warn'))
+
+    def _handle_serial_error(self, error: SerialException):
+        logger.warning(f"Device not detected\n{error.__str__()}")
+        self.to_gui.emit(EvtPopMsgBox("Device not detected", f"{error.__str__()}", 'warn'))
+        self.disconnect_device()
+        self.get_devices()
 
     @property
     def is_connected(self) -> bool:
@@ -203,9 +277,22 @@ class SciospecEITDevice(
 
     def send_cmd(self, cmd: SciospecCmd, op: SciospecOption) -> bool:
         """Send a command option to interface via the communicator"""
-        data = self.setup.get_data(cmd, op)
+        data = self._get_data(cmd, op)
         return self.communicator.send_cmd_frame(self.serial_interface, cmd, op, data)
 
+    def send_cmds(self, cmd_ops: Iterable[tuple[SciospecCmd, SciospecOption]]) -> bool:
+        """Send several command options at once to interface via the
+        communicator (the data are read out of the setup in the given order)"""
+        cmds = [(cmd, op, self._get_data(cmd, op)) for cmd, op in cmd_ops]
+        return self.communicator.send_cmd_frames(self.serial_interface, cmds)
+
+    def _get_data(self, cmd: SciospecCmd, op: SciospecOption) -> list[bytes]:
+        """Return the data of the setup for a command option (none for the
+        commands with prebuilt frame)"""
+        if self.communicator.is_static(cmd, op):
+            return []
+        return self.setup.get_data(cmd, op)
+
     # def listen_activate(self, activate:bool=True):
     #     """"""
 
@@ -214,11 +301,7 @@ class SciospecEITDevice(
         in that case the measurement mode will be stopped on the device
 
         should be Triggered from meas_dataset"""
-
-        if not self.is_measuring:
-            return
-        burst = self.setup.get_burst()
-        if burst > 0 and data.nb_frame_measured == burst:
+        if self._burst_target and data.nb_frame_measured == self._burst_target:
             self.stop_meas()
 
     def check_not_measuring(force_stop: bool = False):
@@ -247,22 +330,19 @@ class SciospecEITDevice(
                 # else:
                 #     logger.debug("check_not_measuring not args kwargs")
 
-                msg = None
-                run_func = False
                 if not self.is_measuring:  # if not measuring >> run func
-                    run_func = True
-                elif force_stop:
+                    return func(self, *args, **kwargs)
+
+                if force_stop:
                     self.stop_meas()
                     msg = "Measurements have been stopped"
-                    run_func = True
                 else:
                     msg = "Please stop measurements first"
-                if msg:  # show msg only if msg is not empty/None
-                    logger.info(f'"Measurements still running!, {msg}')
-                    glob_utils.dialog.Qt_dialogs.infoMsgBox(
-                        "Measurements still running!", msg
-                    )
-                return func(self, *args, **kwargs) if run_func else None
+                logger.info('"Measurements still running!, %s', msg)
+                glob_utils.dialog.Qt_dialogs.infoMsgBox(
+                    "Measurements still running!", msg
+                )
+                return func(self, *args, **kwargs) if force_stop else None
 
             return wrap
 
@@ -285,11 +365,27 @@ class SciospecEITDevice(
         - Device infos are ask and if an ack is get: it is a Sciospec device..."""
         ports = self.serial_interface.get_ports_available()
         self.sciospec_devices = {}
-        for port in ports:
-            device_name = self._check_is_sciospec_dev(port)
+        # the port of the connected device is not probed (it is already open
+        # and listened by the interface), its actual device name is kept
+        connected_port = (
+            self.serial_interface.get_port_name() if self.is_connected else None
+        )
+        if connected_port is not None:
+            self.sciospec_devices[self.device_name] = connected_port
+        ports_to_probe = [port for port in ports if port != connected_port]
+        if not ports_to_probe:
+            device_names = []
+        else:
+            # each port is probed on its own, so that all can be probed at once
+            with ThreadPoolExecutor(max_workers=len(ports_to_probe)) as executor:
+                device_names = list(
+                    executor.map(self._check_is_sciospec_dev, ports_to_probe)
+                )
+        for port, device_name in zip(ports_to_probe, device_names):
             if device_name is not None:
                 self.sciospec_devices[device_name] = port
-                self.device_name = device_name
+                if connected_port is None:
+                    self.device_name = device_name
         self.to_gui.emit(EvtDataSciospecDevices(self.sciospec_devices))
         logger.info(f"Sciospec devices available: {list(self.sciospec_devices)}")
         return self.sciospec_devices
@@ -335,16 +431,28 @@ class SciospecEITDevice(
 
     def _check_is_sciospec_dev(self, port) -> Union[str, None]:
         """Return a device name if the device presents on the port is a
-        sciospec device otherwise return `None`"""
-        tmp_sn = self.setup.get_sn(in_bytes=True)
-        device_name = None
-        self._connect_interface(port)
-        self._stop_meas()  # in case that the device is still measuring!
-        self.get_device_infos()
-        device_name = self.setup.build_sciospec_device_name(port)
-        self._disconnect_interface()
-        self.setup.set_sn(tmp_sn)
-        return device_name
+        sciospec device otherwise return `None`
+
+        The port is probed directly (without the interface and the
+        communicator) and the device infos are set in a temporary setup, so
+        that this method can run for several ports concurrently. The answer
+        is waited only for PROBE_TIMEOUT, so that a port without Sciospec
+        device is rejected quickly
+        """
+        # stop first, in case that the device is still measuring!
+        frames = self.communicator.static_frames
+        tx_frame = (
+            frames[(CMD_START_STOP_MEAS.tag, OP_STOP_MEAS.tag)]
+            + frames[(CMD_GET_DEVICE_INFOS.tag, OP_NULL.tag)]
+        )
+        rx_frame = self.serial_interface.probe(
+            port, tx_frame, CMD_GET_DEVICE_INFOS.tag, PROBE_TIMEOUT
+        )
+        if rx_frame is None:
+            return None
+        setup = SciospecSetup(self.n_channel)
+        setup.set_data(rx_setup_stream=rx_frame)
+        return setup.build_sciospec_device_name(port)
 
     def _get_sciospec_port(self, device_name: str) -> Union[str, None]:
         """Asset if a port is defined for device name, and returen it if yes"""
@@ -371,12 +479,12 @@ class SciospecEITDevice(
     def start_paused_resume_meas(self, *args, **kwargs) -> bool:
         """Switcht Measuring mode to assure
         start, pause and resume functionality"""
-        if self.is_status(MeasuringStatus.NOT_MEASURING):
+        if self.is_idle:
             self.to_dataset.emit(DataInit4Start(self.setup))
             self._begin_meas()
-        elif self.is_status(MeasuringStatus.MEASURING):
+        elif self.is_measuring:
             self._pause_meas()
-        elif self.is_status(MeasuringStatus.PAUSED):
+        elif self.is_paused:
             self._resume_meas()
 
     def stop_meas(self, *args, **kwargs) -> None:
@@ -421,8 +529,12 @@ class SciospecEITDevice(
 
         Send cmd to device
         """
+        # set before sending, as the first frames can come before the ack
+        self._burst_target = self.setup.get_burst()
         success = self.send_cmd(CMD_START_STOP_MEAS, OP_START_MEAS)
         self.communicator.wait_not_busy()
+        if not success:
+            self._burst_target = 0
         return success
 
     def _stop_meas(self) -> bool:
@@ -430,6 +542,7 @@ class SciospecEITDevice(
 
         Send cmd to device
         """
+        self._burst_target = 0
         success = self.send_cmd(CMD_START_STOP_MEAS, OP_STOP_MEAS)
         self.communicator.wait_not_busy()
         return success
@@ -450,18 +563,13 @@ class SciospecEITDevice(
     def set_setup(self, *args, **kwargs) -> None:
         """Send the setup to the device"""
         logger.info("Setting device setup - start...")
-        self.send_cmd(CMD_SET_OUTPUT_CONFIG, OP_EXC_STAMP)
-        self.send_cmd(CMD_SET_OUTPUT_CONFIG, OP_CURRENT_STAMP)
-        self.send_cmd(CMD_SET_OUTPUT_CONFIG, OP_TIME_STAMP)
-        self.send_cmd(CMD_SET_ETHERNET_CONFIG, OP_DHCP)
-        self.send_cmd(CMD_SET_MEAS_SETUP, OP_RESET_SETUP)
-        self.send_cmd(CMD_SET_MEAS_SETUP, OP_EXC_AMPLITUDE)
-        self.send_cmd(CMD_SET_MEAS_SETUP, OP_BURST_COUNT)
-        self.send_cmd(CMD_SET_MEAS_SETUP, OP_FRAME_RATE)
-        self.send_cmd(CMD_SET_MEAS_SETUP, OP_EXC_FREQUENCIES)
-        for idx in range(len(self.setup.get_exc_pattern())):
-            self.setup.set_exc_pattern_idx(idx)
-            self.send_cmd(CMD_SET_MEAS_SETUP, OP_EXC_PATTERN)
+        cmds = [(cmd, op, self._get_data(cmd, op)) for cmd, op in self.SET_SETUP_SEQ]
+        # the data of all excitation patterns are computed at once
+        cmds.extend(
+            (CMD_SET_MEAS_SETUP, OP_EXC_PATTERN, data)
+            for data in self.setup.get_exc_patterns_data()
+        )
+        self.communicator.send_cmd_frames(self.serial_interface, cmds)
         self.communicator.wait_not_busy()
         self.get_setup()
         logger.info("Setting device setup - done")
@@ -470,17 +578,7 @@ class SciospecEITDevice(
     def get_setup(self, *args, **kwargs) -> None:
         """Get the setup of the device"""
         logger.info("Getting device setup - start...")
-        self.send_cmd(CMD_GET_MEAS_SETUP, OP_EXC_AMPLITUDE)
-        self.send_cmd(CMD_GET_MEAS_SETUP, OP_BURST_COUNT)
-        self.send_cmd(CMD_GET_MEAS_SETUP, OP_FRAME_RATE)
-        self.send_cmd(CMD_GET_MEAS_SETUP, OP_EXC_FREQUENCIES)
-        self.send_cmd(CMD_GET_MEAS_SETUP, OP_EXC_PATTERN)
-        self.send_cmd(CMD_GET_OUTPUT_CONFIG, OP_EXC_STAMP)
-        self.send_cmd(CMD_GET_OUTPUT_CONFIG, OP_CURRENT_STAMP)
-        self.send_cmd(CMD_GET_OUTPUT_CONFIG, OP_TIME_STAMP)
-        self.send_cmd(CMD_GET_ETHERNET_CONFIG, OP_IP_ADRESS)
-        self.send_cmd(CMD_GET_ETHERNET_CONFIG, OP_MAC_ADRESS)
-        self.send_cmd(CMD_GET_ETHERNET_CONFIG, OP_DHCP)
+        self.send_cmds(self.GET_SETUP_SEQ)
         self.communicator.wait_not_busy()
         self.to_gui.emit(EvtDataSciospecDevSetup(self.setup))
         logger.info("Getting device setup - done")
@@ -493,7 +591,22 @@ class SciospecEITDevice(
         logger.info("Softreset of device - start...")
         self.send_cmd(CMD_SOFT_RESET, OP_NULL)
         self.communicator.wait_not_busy()
-        sleep(10)
+        # the device is pinged at growing intervals until it answers again
+        deadline = monotonic() + RESET_TIMEOUT
+        dt = 0.1
+        ready = False
+        while not ready and monotonic() < deadline:
+            sleep(dt)
+            dt = min(2 * dt, 1.0)
+            # a failed write is already handled by the interface error
+            if not self.is_connected or not self.send_cmd(
+                CMD_GET_DEVICE_INFOS, OP_NULL
+            ):
+                break
+            ready = self.communicator.wait_not_busy(PROBE_TIMEOUT, log_timeout=False)
+        if not ready:
+            logger.error("Softreset of device - device not ready after reset")
+            return
         logger.info("Softreset of device - done")
         glob_utils.dialog.Qt_dialogs.infoMsgBox("Device reset ", "Reset done")
 
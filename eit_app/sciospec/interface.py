@@ -41,8 +41,10 @@ from abc import ABC, abstractmethod
 
 from glob import glob
 import logging
+import os
 import sys
-from time import sleep
+import threading
+from time import monotonic, sleep
 from typing import Union, Any
 
 from serial import (
@@ -58,6 +60,9 @@ from glob_utils.flags.flag import CustomFlag
 logger = logging.getLogger(__name__)
 
 SER_TIMEOUT = 0.1
+# on Linux the available bytes are read directly out of the file descriptor
+# of the port (without the checks and the select of `Serial.read`)
+READ_FROM_FD = sys.platform.startswith("linux")
 SERIAL_BAUD_RATE_DEFAULT = 115200
 HARDWARE_NOT_DETECTED = 0xFF
 
@@ -148,6 +153,10 @@ class SciospecSerialInterface(Interface):
         """Constructor responsible of attrs init and starting the HW Poller(thread)"""
         super().__init__(name_listener_thread="serial listener", sleeptime=0.01)
         self.rx_frame = None  # last response retrieved by polling
+        self._rx_buf = bytearray()  # recieved bytes not yet sliced in frames
+        # the rx buffer is filled by the listener and cleared by the gui thread
+        # (reentrant: a read error can reinit the interface in the listener)
+        self._rx_buf_lock = threading.RLock()
         self.serial_port = Serial()
         self.is_connected.set(self.serial_port.is_open)
         self.ports_available = []
@@ -188,11 +197,9 @@ class SciospecSerialInterface(Interface):
     # @abstractmethod
     def listen(self):
         """Listen the serial port"""
-        self.rx_frame = self._get_rx_frame()
-        if self.rx_frame is None:
-            return
-        kwargs = {"rx_frame": self.rx_frame}
-        self.new_rx_frame.emit(**kwargs)
+        for rx_frame in self._get_rx_frames():
+            self.rx_frame = rx_frame
+            self.new_rx_frame.emit(rx_frame=rx_frame)
 
     def _catch_error(return_result: bool = False, return_success: bool = False):
         """_summary_
@@ -215,16 +222,13 @@ class SciospecSerialInterface(Interface):
                         self.close()
                     if "PermissionError(13" in error.__str__():
                         self.close()
-                    kwargs = {"error": error}
-                    self.error.emit(**kwargs)
+                    self.error.emit(error=error)
                     # logger.debug(traceback.format_exc())
                 except PortNotOpenError as error:
-                    kwargs = {"error": error}
-                    self.error.emit(**kwargs)
+                    self.error.emit(error=error)
                     # logger.debug(traceback.format_exc())
                 except OSError as error:
-                    kwargs = {"error": error}
-                    self.error.emit(**kwargs)
+                    self.error.emit(error=error)
                     # logger.debug(traceback.format_exc())
 
                 if return_result:
@@ -240,6 +244,7 @@ class SciospecSerialInterface(Interface):
         """Reinit the interface"""
         self.ports_available = []
         self.rx_frame = None
+        self._clear_rx_buf()
         logger.debug("Reinitialisation of SciospecSerialInterface - DONE")
 
     def get_port_name(self):
@@ -289,6 +294,52 @@ class SciospecSerialInterface(Interface):
 
         return self.ports_available
 
+    @staticmethod
+    def probe(
+        port: str,
+        tx_frame: Union[list[bytes], bytes],
+        rx_cmd_tag: int,
+        timeout: float = SER_TIMEOUT,
+    ) -> Union[list[bytes], None]:
+        """Write a frame on a port and return the first recieved frame with
+        the command tag `rx_cmd_tag`
+
+        The port is opened with its own Serial object (the listener and the
+        rx buffer of the interface are not used), so that several ports can
+        be probed concurrently.
+
+        Args:
+            port (str): serial port e.g. "COM1"
+            tx_frame (Union[list[bytes], bytes]): frame(s) to write
+            rx_cmd_tag (int): command tag of the expected frame
+            timeout (float, optional): max waiting time for each recieved
+            frame, in s. The whole probe is stopped after 10 x timeout.
+            Defaults to SER_TIMEOUT.
+
+        Returns:
+            Union[list[bytes], None]: the recieved frame, `None` if the port
+            could not be opened or the frame did not come in time
+        """
+        deadline = monotonic() + 10 * timeout
+        try:
+            with Serial(port, SERIAL_BAUD_RATE_DEFAULT, timeout=timeout) as ser:
+                ser.reset_input_buffer()
+                ser.write(bytearray(tx_frame))
+                while monotonic() < deadline:
+                    # a frame is: CMD, length (LL), (data...), CMD
+                    head = ser.read(LENGTH_BYTE_INDX + 1)
+                    if len(head) <= LENGTH_BYTE_INDX:
+                        return None
+                    n_bytes = head[LENGTH_BYTE_INDX] + 1
+                    tail = ser.read(n_bytes)
+                    if len(tail) < n_bytes:
+                        return None
+                    if head[CMD_BYTE_INDX] == rx_cmd_tag:
+                        return list(head + tail)
+        except (OSError, SerialException) as error:
+            logger.debug("Probing serial port: %s - FAIL (%s)", port, error)
+        return None
+
     def _clear_unwanted_rx_frames(self):
         """Clear recieved data by reading them
 
@@ -301,12 +352,19 @@ class SciospecSerialInterface(Interface):
         while self.read_nb_of_availables_bytes():
             sleep(0.5)
             logger.debug(f"clear: {self.serial_port.read_all()}")
+        self._clear_rx_buf()
+
+    def _clear_rx_buf(self):
+        """Clear the recieved bytes not yet sliced in frames"""
+        with self._rx_buf_lock:
+            self._rx_buf.clear()
 
     # def _stop_measurements(self):
     #     self.write([CMD_START_STOP_MEAS.tag, 0x01, 0x00, CMD_START_STOP_MEAS.tag])
 
     @_catch_error(return_success=True)
     def _open(self, **kwargs):
+        self._clear_rx_buf()
         self.serial_port = Serial(**kwargs)
         # read everything the device could send
         self.serial_port.reset_output_buffer()
@@ -320,40 +378,33 @@ class SciospecSerialInterface(Interface):
     @_catch_error(return_success=True)
     def _write(self, data: list[bytes]):
         self.serial_port.write(bytearray(data))
-        logger.debug(f"TX: {data}")
+        logger.debug("TX: %s", data)
         self.serial_port.flush()
 
-    def _get_rx_frame(self) -> Union[list[bytes], None]:
-        """Return a complete data frame if available on the port
+    def _get_rx_frames(self) -> list[bytes]:
+        """Return the complete data frames available on the port
+
+        All the bytes available on the port are read at once and added to
+        an internal buffer, out of which the complete frames are sliced.
+        The bytes of an incomplete frame stay in the buffer until the next
+        call. Each frame is copied once out of the buffer as an immutable
+        `bytes` object (indexing it returns the byte values as int)
 
         Returns:
-            Union[list[bytes], None]: complete data frame or
-            None if not availbale or an error occurs
+            list[bytes]: complete data frames (empty if none available
+            or an error occurs)
         """
-        # a frame is at least 4 bytes
-        n_bytes = self.read_nb_of_availables_bytes()
-        if n_bytes is None or n_bytes < FRAME_LENGTH_MIN:
-            return None
-        # read up to the length byte
-        rx_frame = self.read_bytes(LENGTH_BYTE_INDX + 1)
-        if rx_frame is None:
-            return None
-        # read also the additional "ending CMD Byte"
-        length_data2read = rx_frame[LENGTH_BYTE_INDX] + 1
-        # dangerous ...timer use?
-        while 1:
+        with self._rx_buf_lock:
             n_bytes = self.read_nb_of_availables_bytes()
-            if n_bytes is None:
-                return None
-            if not n_bytes < length_data2read:
-                break
-
-        tmp = self.read_bytes(length_data2read)
-        if tmp is None:
-            return None
-        rx_frame.extend(tmp)
-        logger.debug(f"RX: {rx_frame[:10]}")
-        return rx_frame
+            if n_bytes:
+                data = self._read_raw(n_bytes)
+                if data:
+                    self._rx_buf.extend(data)
+
+            rx_frames = slice_rx_frames(self._rx_buf)
+        for rx_frame in rx_frames:
+            logger.debug("RX: %s", rx_frame[:10])
+        return rx_frames
 
     def read_nb_of_availables_bytes(self) -> Union[int, None]:
         """Return the number of bytes available on the input buffer of the
@@ -380,6 +431,15 @@ class SciospecSerialInterface(Interface):
         """
         return self._read_bytes(nb_bytes)
 
+    @_catch_error(return_result=True)
+    def _read_raw(self, nb_bytes: int) -> bytes:
+        # can raise a SerialException("ClearCommError failed ({!r})".format(ctypes.WinError()))
+        # can raise a PortNotOpenError()
+        if READ_FROM_FD:
+            # only called for bytes already available, os.read does not block
+            return os.read(self.serial_port.fileno(), nb_bytes)
+        return self.serial_port.read(nb_bytes)
+
     @_catch_error(return_result=True)
     def _read_bytes(self, nb_bytes: int = 1) -> list[bytes]:
         # can raise a SerialException("ClearCommError failed ({!r})".format(ctypes.WinError()))
@@ -8,7 +8,7 @@ import numpy as np
 from eit_app.default.set_default_dir import APP_DIRS, AppStdDir
 from eit_app.sciospec.constants import OPTION_BYTE_INDX
 from eit_app.sciospec.setup import SciospecSetup
-from eit_app.sciospec.utils import convert4Bytes2Float, convertBytes2Int
+from eit_app.sciospec.utils import convertBytes2Int, convert_meas_data
 from eit_app.com_channels import (
     AddToCaptureSignal,
     AddToComputationSignal,
@@ -134,13 +134,19 @@ class RXMeasStreamData:
         """See in Sciospec documentation"""
         rx_data = rx_meas_stream[OPTION_BYTE_INDX:-1]
         self.ch_group = rx_data[0]
-        self.exc_indx = self._find_excitation_indx(rx_data[1:3], excitation)
+        self.exc_indx = self._find_excitation_indx(list(rx_data[1:3]), excitation)
         self.freq_indx = convertBytes2Int(rx_data[3:5])
         self.time_stamp = convertBytes2Int(rx_data[5:9])
         self.voltage = convert_meas_data(rx_data[9:])
-        logger.debug(
-            f"RX MEAS data: {self.ch_group=}, {self.exc_indx=}, {self.freq_indx=}, {self.time_stamp=}, {self.voltage=} - TREATED"
-        )
+        if logger.isEnabledFor(logging.DEBUG):  # avoid formatting of voltage
+            logger.debug(
+                "RX MEAS data: ch_group=%s, exc_indx=%s, freq_indx=%s, time_stamp=%s, voltage=%s - TREATED",
+                self.ch_group,
+                self.exc_indx,
+                self.freq_indx,
+                self.time_stamp,
+                self.voltage,
+            )
 
     # def is_first(self):
     #     return self.ch_group + self.freq_indx + self.exc_indx == 1
@@ -206,7 +212,6 @@ class VoltageMeas(object):
 
     def set_voltages(self, U: np.ndarray) -> None:
         self.voltage[0:16, 0:16] = U
-        print(f"{self.voltage}")
 
     @property
     def __dict__(self):
@@ -227,9 +232,10 @@ class VoltageMeas(object):
         # special setting of voltages >> back to ndarray dtype= complex
         volt = kwargs.pop("voltage", {})
         if all(key in volt for key in ["array_real", "array_imag"]):
-            self.voltage = np.array(volt["array_real"]) + 1j * np.array(
-                volt["array_imag"]
-            )
+            real = np.asarray(volt["array_real"], dtype=np.float64)
+            self.voltage = np.empty(real.shape, dtype=np.complex128)
+            self.voltage.real = real
+            self.voltage.imag = volt["array_imag"]
 
         # set all others passed attr
         for k, v in kwargs.items():
@@ -288,7 +294,7 @@ class MeasurementFrame(object):
         self._meas_stream_max = len(self.excitation) * 2
         self._meas_stream_cnt = 0
         self.info = self.build_info_frame()
-        logger.debug(f"Initialisation of Frame:{self.__dict__}")
+        logger.debug("Initialisation of Frame:%s", self.__dict__)
 
     def set_from_dict(self, **kwargs):
         """Set attributes by passing kwargs or a dict.
@@ -428,7 +434,7 @@ class MeasurementFrame(object):
         path = self.path if path is None else path
         d = dict_nested(self, ignore_private=True)
         save_to_json(path, d)
-        logger.debug(f"Frame #{self.idx} saved in: {self.path}")
+        logger.debug("Frame #%s saved in: %s", self.idx, self.path)
         visualise(d)
 
     def load(self, path: str) -> bool:
@@ -440,7 +446,7 @@ class MeasurementFrame(object):
         # correct the frame path (if dataset moved...)
         frame_as_dict["path"] = path
         self.set_from_dict(**frame_as_dict)
-        logger.debug(f"Frame #{self.idx} loaded : {self.path}")
+        logger.debug("Frame #%s loaded : %s", self.idx, self.path)
         visualise(frame_as_dict)
         return True
 
@@ -569,7 +575,7 @@ class MeasurementDataset(
         if not self._rx_meas_frame.is_complete():
             return
 
-        logger.info(f"Frame #{self.frame_cnt} - complete")
+        logger.info("Frame #%s - complete", self.frame_cnt)
         idx = 0
         self.meas_frame[idx] = self._rx_meas_frame
         if self.frame_cnt == 0:
@@ -631,7 +637,11 @@ class MeasurementDataset(
         vref = self._get_vref()
         vmeas = self._get_vmeas()
 
-        logger.debug(f"Emit Frame for computation {vmeas.labels=} {vref.labels=}")
+        logger.debug(
+            "Emit Frame for computation vmeas.labels=%r vref.labels=%r",
+            vmeas.labels,
+            vref.labels,
+        )
 
         self.to_gui.emit(
             EvtDataNewFrameInfo(self.get_meas_info(self.extract_idx.meas_idx))
@@ -644,12 +654,9 @@ class MeasurementDataset(
 
     def emit_progression(self) -> None:
         """Send signal to update Frame aquisition progress bar"""
-        logger.debug(
-            f"Emit progression frame# {self.get_frame_cnt()} fill:{self.get_filling()} "
-        )
-        self.to_gui.emit(
-            EvtDataNewFrameProgress(self.get_frame_cnt(), self.get_filling())
-        )
+        frame_cnt, filling = self.get_frame_cnt(), self.get_filling()
+        logger.debug("Emit progression frame# %s fill:%s ", frame_cnt, filling)
+        self.to_gui.emit(EvtDataNewFrameProgress(frame_cnt, filling))
 
     def _get_vref(self) -> EITChannelVoltage:
         ref_idx = self.extract_idx.ref_idx
@@ -929,20 +936,6 @@ class MeasurementDataset(
         self._update_gui_autosave()
 
 
-def convert_meas_data(meas_data):
-    """return float voltages values () corresponding to meas data
-    (bytes single float)
-    """
-    n_bytes_real_imag = 4  # we got 4Bytes per value
-    # reshape the meas data in block of 4 bytes
-    meas_data = np.reshape(np.array(meas_data), (-1, n_bytes_real_imag))
-    meas_data = meas_data.tolist()  # back to list for conversion
-    meas_f = [convert4Bytes2Float(m) for m in meas_data]  # conversion of each 4 bytes
-    # get a matrix with real and imag values in each column
-    meas_r_i = np.reshape(np.array(meas_f), (-1, 2))
-    return meas_r_i[:, 0] + 1j * meas_r_i[:, 1]
-
-
 if __name__ == "__main__":
     import glob_utils.log.log
     from eit_app.sciospec.measurement import MeasurementDataset
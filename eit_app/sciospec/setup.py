@@ -718,6 +718,27 @@ class SciospecSetup(SetupBase):
             else self.exc_pattern
         )
 
+    def get_exc_patterns_data(self) -> list[bytes]:
+        """Return the data of all excitation patterns for sending to the device
+        (as get_exc_pattern(in_bytes=True) for each index, computed at once)
+        """
+        # the whole pattern table is encoded at once, a row per pattern, if
+        # all patterns have the same length (otherwise pattern per pattern)
+        if len({len(pattern) for pattern in self.exc_pattern}) == 1:
+            rows = np.asarray(self.exc_pattern, dtype=np.int64)
+        else:
+            rows = [np.asarray(pattern, dtype=np.int64) for pattern in self.exc_pattern]
+        data = []
+        for row in rows:
+            # a cast to uint8 would silently wrap the out of range values
+            if row.size and (row.min() < 0 or row.max() > 255):
+                raise ValueError(
+                    f"Excitation pattern values should be in 0..255: {row.tolist()}"
+                )
+            # an empty pattern is sent as [0x00] (as in get_data)
+            data.append(row.astype(np.uint8).tobytes() or bytes([0x00]))
+        return data
+
     def get_exc_pattern_mdl(self):
         """Return excitation pattern from model:"""
         return self.exc_pattern_mdl
@@ -127,6 +127,18 @@ def convertBoolToByte(val: bool) -> bytes:
     return val.to_bytes(1, byteorder="big")
 
 
+def convert_meas_data(meas_data):
+    """return float voltages values () corresponding to meas data
+    (bytes single float)
+    """
+    # all values are decoded at once out of the raw bytes (4 Bytes per value,
+    # big-endian single float, see documentation of the EIT device)
+    meas_f = np.frombuffer(bytes(meas_data), dtype=">f4").astype(np.float64)
+    # consecutive (real, imag) float64 pairs are directly viewed as complex
+    # values (no temporary arrays for the real/imag parts)
+    return meas_f.view(np.complex128)
+
+
 if __name__ == "__main__":
 
     meas_data = [
@@ -1,30 +1,39 @@
 """To update the gui an UpdateAgent is here defined. By posting data through 
 the agent, a specified part of the gui will be updated
 
-Those data has to be EventdataClass and should contain a updating function 
-to run as string and corresponding specific data. 
+Those data has to be EventdataClass and should contain the updating function 
+to run and corresponding specific data. 
 
-Each updating function has to to be registered in a the Catalog UPDATE_EVENTS
-trouh the call
->> register_func_in_catalog(updating_func)
+Each updating function has to be bound to its EventdataClass (set as class
+attribute `__dispatch__`) using the decorator `bind_event`:
+>> @bind_event(EvtDataFoo)
+>> def updating_func(ui, ...):
 
 """
 
 from abc import ABC
-from dataclasses import dataclass, is_dataclass
+from dataclasses import InitVar, dataclass, field, fields
+from functools import lru_cache, wraps
 import logging
-from typing import Any, Callable
+import threading
+import time
+from typing import Any, Callable, ClassVar, NamedTuple, Union
+from weakref import WeakKeyDictionary
 from PyQt5 import QtGui, QtWidgets
 from eit_app.default.set_default_dir import AppStdDir, get_dir
 
 from eit_app.gui import Ui_MainWindow
 from eit_app.gui_utils import (
     block_signals,
+    get_comboBox_allItemsText,
     set_QSlider_position,
     set_comboBox_index,
     set_comboBox_items,
+    set_comboBox_strings,
     set_QSlider_scale,
     set_QTableWidget,
+    set_if_changed,
+    updates_disabled,
 )
 from eit_app.sciospec.setup import SciospecSetup
 from eit_model.imaging import (
@@ -43,10 +52,6 @@ import glob_utils.dialog.Qt_dialogs
 logger = logging.getLogger(__name__)
 
 
-def is_dataclass_instance(obj) -> bool:
-    return is_dataclass(obj) and not isinstance(obj, type)
-
-
 ################################################################################
 # Event Dataclass use to trigger an update
 ################################################################################
@@ -55,7 +60,88 @@ def is_dataclass_instance(obj) -> bool:
 class EventDataClass(ABC):
     """Abstract class of the dataclass defined for each update events"""
 
-    func: str
+    __dispatch__: ClassVar[Callable]
+
+    def memo_key(self) -> Any:
+        """Return a hashable key representing the content of the event data.
+
+        If the key is equal to the one of the last event data posted for
+        the same update function, the update is skipped (the GUI is already
+        up to date). Return `None` (default) to always run the update.
+        """
+        return None
+
+    def coalesce_key(self) -> Any:
+        """Return a hashable key for the coalescing of event data.
+
+        If several event data of the same type with the same key are waiting
+        to be posted, only the last one is posted (e.g. for events of which
+        only the latest state matters). Return `None` (default) to post all
+        of them.
+        """
+        return None
+
+
+class StateEventDataClass(EventDataClass):
+    """Event data carrying a whole state to display (setup, status, image...),
+    of which only the latest one matters: if several are waiting to be
+    posted, only the last one is posted"""
+
+    def coalesce_key(self) -> Any:
+        return True
+
+
+# field names of each EventDataClass, computed once per class
+_FIELD_NAMES: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def bind_event(evt_cls: type) -> Callable:
+    """Decorator binding an updating function to an EventDataClass, the
+    function is run by the UpdateAgent when an instance of `evt_cls` is posted
+
+    Args:
+        evt_cls (type): EventDataClass to bind the decorated function to
+    """
+
+    def decorator(func: Callable) -> Callable:
+        evt_cls.__dispatch__ = staticmethod(func)
+        return func
+
+    return decorator
+
+
+def throttle(min_interval_s: float, let_pass: Callable[..., bool] = None) -> Callable:
+    """Decorator limiting the rate of an updating function, the calls arriving
+    less than `min_interval_s` after the last run are dropped
+
+    Args:
+        min_interval_s (float): minimal interval between two runs in seconds
+        let_pass (Callable[..., bool], optional): called with the kwargs of
+        the updating function, calls for which it returns `True` are never
+        dropped (e.g. final state). Defaults to `None`.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        last_run = 0.0
+
+        @wraps(func)
+        def wrapper(**kwargs):
+            nonlocal last_run
+            now = time.monotonic()
+            if now - last_run < min_interval_s and not (
+                let_pass is not None and let_pass(**kwargs)
+            ):
+                return
+            last_run = now
+            func(**kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _no_log(*args, **kwargs) -> None:
+    """Replace a logging method when its level is disabled"""
 
 
 ################################################################################
@@ -64,18 +150,23 @@ class EventDataClass(ABC):
 
 
 class UpdateAgent:
-    def __init__(self, ui, events_ctlg) -> None:
+    def __init__(self, ui) -> None:
         """This agent runs updating funntion of the Gui (app)
         depending on the data posted
 
         Args:
-            app (_type_): GUI, Ui_MainWindow
-            events (_type_): event catalog, a registed of all updating
-            function callbacks
+            ui (_type_): GUI, Ui_MainWindow
         """
-        self._subscribers = {}
+        # callbacks subscribed per event data type, this dict is never
+        # modified but replaced (copy on write), so it is read without lock
+        self._subscribers: dict[type, tuple[Callable]] = {}
+        self._subscribers_lock = threading.Lock()
         self._ui = ui
-        self._events_ctlg = events_ctlg
+        # last memo key for each update function (see EventDataClass.memo_key)
+        self._memo = {}
+        # logging level is checked once here, so that on the update path no
+        # logging call (and no arguments formatting) is made if not needed
+        self._debug = logger.debug if logger.isEnabledFor(logging.DEBUG) else _no_log
 
     @catch_error
     def post(self, data: EventDataClass) -> None:
@@ -84,44 +175,70 @@ class UpdateAgent:
         Args:
             data (EventDataClass): event data
         """
-        if not is_dataclass_instance(data) or not isinstance(data, EventDataClass):
+        # `__dispatch__` is only set on EventDataClass bound to an updating
+        # function, it acts as marker of valid event data
+        try:
+            func = type(data).__dispatch__
+        except AttributeError:
             logger.error("data are not compatible for update")
             return
 
-        # logger.debug(f"thread update_event {threading.get_ident()}")
-        data = self._mk_dict(data)
-        func = data.pop("func")
-        # logger.debug(f"updating {func=} with {data=}")
-        self._events_ctlg[func](**data)
+        self._update(func, data)
+        for callback in self._subscribers.get(type(data), ()):
+            callback(data)
+
+    def subscribe(self, evt_cls: type, callback: Callable) -> None:
+        """Subscribe a callback, which will be called with each event data of
+        type `evt_cls` posted (after the update of the gui)
+
+        Args:
+            evt_cls (type): EventDataClass to subscribe to
+            callback (Callable): callback, called as callback(data)
+        """
+        with self._subscribers_lock:
+            subscribers = dict(self._subscribers)
+            subscribers[evt_cls] = (*subscribers.get(evt_cls, ()), callback)
+            self._subscribers = subscribers
+
+    def _update(self, func: Callable, data: EventDataClass) -> None:
+        """Run the updating function with the event data, if the gui is not
+        already up to date (see EventDataClass.memo_key)
+
+        Args:
+            func (Callable): updating function
+            data (EventDataClass): event data
+        """
+        key = data.memo_key()
+        if key is not None and self._memo.get(func) == key:
+            self._debug("skip %s, nothing has changed", func.__name__)
+            return
+
+        self._debug("thread update_event %s", threading.get_ident())
+        self._debug("updating %s with %s", func.__name__, data)
+        # reset the key first, so that after an error the next update runs
+        self._memo[func] = None
+        func(**self._mk_dict(data))
+        self._memo[func] = key
 
     def _mk_dict(self, data: EventDataClass) -> dict:
-        """Transform the event data in dict and add the "app" key
+        """Build a new dict out of the event data fields and add the "ui" key
+        (the event data are not modified)
 
         Args:
             data (EventDataClass): event data
 
         Returns:
-            dict: data as dict with added "app" key
+            dict: data as dict with added "ui" key
         """
-        d = data.__dict__
+        cls = type(data)
+        names = _FIELD_NAMES.get(cls)
+        if names is None:
+            names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+        d = {name: getattr(data, name) for name in names}
         d["ui"] = self._ui
         return d
 
 
-################################################################################
-# Update events Catalog
-################################################################################
-
-# catalog of update functions event
-UPDATE_EVENTS: dict[str, Callable] = {}
-
-
-def register_func_in_catalog(func: Callable) -> None:
-    """Add the function to the UPDATE_EVENTS catalog"""
-    name = func.__name__
-    UPDATE_EVENTS[func.__name__] = func
-
-
 ################################################################################
 # Update fucntions and assiociated EventDataClass
 ################################################################################
@@ -132,16 +249,14 @@ def register_func_in_catalog(func: Callable) -> None:
 # ## Update somthing
 # # ------------------------------------------------------------------------------
 
-# def update_something(ui: Ui_MainWindow, data: Any)->None:
-#     """code for updating somteh from app"""
-
-# register_func_in_catalog(update_something)
-
-# @dataclass
+# @dataclass(frozen=True)
 # class EvtDataFoo(EventDataClass):
 #     """Event data to update the list of detected sciospec device"""
 #     data: Any
-#     func: str = update_something.__name__
+
+# @bind_event(EvtDataFoo)
+# def update_something(ui: Ui_MainWindow, data: Any)->None:
+#     """code for updating somteh from app"""
 
 
 # -------------------------------------------------------------------------------
@@ -156,98 +271,92 @@ orange_light = "#ffd062"
 
 # colors for buttons
 bck_gnd_buttons = "#00aaff"
+bck_gnd_buttons_style = "* { background-color: " + f"{bck_gnd_buttons}" + " }"
+
+# styles for the labels of the inputs fields
+lab_style_error = f"background-color: {red_light}"
+lab_style_ok = "background-color: white"
+
+# styles for the device status label
+lab_style_connected = f"background-color: {green_light}; color :white"
+lab_style_disconnected = f"background-color: {red_light}; color :black"
 
 
+@dataclass(frozen=True)
+class EvtInitFormatUI(EventDataClass):
+    """Event data to update the list of detected sciospec device"""
+
+
+@bind_event(EvtInitFormatUI)
 def initial_formatting_of_ui(ui: Ui_MainWindow) -> None:
     """Run some initial custom formating on gui object"""
     # set background of all buttons
-    bck_gnd = "* { background-color: " + f"{bck_gnd_buttons}" + " }"
     for button in ui.centralwidget.findChildren(QtWidgets.QPushButton):
-        button.setStyleSheet(bck_gnd)  # blue
+        button.setStyleSheet(bck_gnd_buttons_style)  # blue
 
 
-register_func_in_catalog(initial_formatting_of_ui)
+# -------------------------------------------------------------------------------
+## Update available EIT devices
+# -------------------------------------------------------------------------------
 
 
-@dataclass
-class EvtInitFormatUI(EventDataClass):
+@dataclass(frozen=True)
+class EvtDataSciospecDevices(StateEventDataClass):
     """Event data to update the list of detected sciospec device"""
 
-    func: str = initial_formatting_of_ui.__name__
+    device: dict
 
-
-# -------------------------------------------------------------------------------
-## Update available EIT devices
-# -------------------------------------------------------------------------------
+    def memo_key(self) -> Any:
+        return tuple(self.device)
 
 
+@bind_event(EvtDataSciospecDevices)
 def update_available_devices(ui: Ui_MainWindow, device: dict) -> None:
     """Refesh the list of devices in the comboBox"""
     items = list(device) or ["None device"]
     set_comboBox_items(ui.cB_ports, items)
 
 
-register_func_in_catalog(update_available_devices)
+# -------------------------------------------------------------------------------
+## Update available capture devices
+# -------------------------------------------------------------------------------
 
 
-@dataclass
-class EvtDataSciospecDevices(EventDataClass):
-    """Event data to update the list of detected sciospec device"""
+@dataclass(frozen=True)
+class EvtDataCaptureDevices(StateEventDataClass):
+    """Do not set func"""
 
     device: dict
-    func: str = update_available_devices.__name__
-
-
-# -------------------------------------------------------------------------------
-## Update available capture devices
-# -------------------------------------------------------------------------------
 
 
+@bind_event(EvtDataCaptureDevices)
 def update_available_capture_devices(ui: Ui_MainWindow, device: dict) -> None:
     """Refesh the list of devices in the comboBox"""
     items = list(device) or ["None device"]
     set_comboBox_items(ui.cB_capture_devices, items)
 
 
-register_func_in_catalog(update_available_capture_devices)
-
-
-@dataclass
-class EvtDataCaptureDevices(EventDataClass):
-    """Do not set func"""
-
-    device: dict
-    func: str = update_available_capture_devices.__name__
-
-
 # -------------------------------------------------------------------------------
 ## Update device status
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtDataSciospecDevConnected(StateEventDataClass):
+
+    connected: bool
+    connect_prompt: str
+
+
+@bind_event(EvtDataSciospecDevConnected)
 def update_device_status(
     ui: Ui_MainWindow, connected: bool, connect_prompt: str
 ) -> None:
     """Actualize the status of the device"""
     ui.lab_device_status.setText(connect_prompt)
     ui.lab_device_status.adjustSize
-    color = (
-        f"background-color: {green_light}; color :white"
-        if connected
-        else f"background-color: {red_light}; color :black"
-    )
-    ui.lab_device_status.setStyleSheet(color)
-
-
-register_func_in_catalog(update_device_status)
-
-
-@dataclass
-class EvtDataSciospecDevConnected(EventDataClass):
-
-    connected: bool
-    connect_prompt: str
-    func: str = update_device_status.__name__
+    style = lab_style_connected if connected else lab_style_disconnected
+    ui.lab_device_status.setStyleSheet(style)
 
 
 # -------------------------------------------------------------------------------
@@ -255,54 +364,121 @@ class EvtDataSciospecDevConnected(EventDataClass):
 # -------------------------------------------------------------------------------
 
 
+class SetupSnapshot(NamedTuple):
+    """Values of a SciospecSetup displayed in the GUI, read at once"""
+
+    sn: str
+    dhcp: bool
+    ip: str
+    mac: str
+    exc_stamp: bool
+    current_stamp: bool
+    time_stamp: bool
+    frame_rate: float
+    max_frame_rate: float
+    burst: int
+    exc_amp: float
+    freq_min: float
+    freq_max: float
+    freq_steps: int
+    freq_scale: str
+    exc_pattern_mdl: tuple[tuple[int]]
+    exc_pattern: tuple[tuple[int]]
+    freqs: tuple[float]
+
+    @classmethod
+    def from_setup(cls, setup: SciospecSetup) -> "SetupSnapshot":
+        return cls(
+            sn=setup.get_sn(),
+            dhcp=bool(setup.ethernet_config.get_dhcp()),
+            ip=setup.ethernet_config.get_ip(),
+            mac=setup.ethernet_config.get_mac(),
+            exc_stamp=bool(setup.output_config.get_exc_stamp()),
+            current_stamp=bool(setup.output_config.get_current_stamp()),
+            time_stamp=bool(setup.output_config.get_time_stamp()),
+            frame_rate=setup.get_frame_rate(),
+            max_frame_rate=setup.get_max_frame_rate(),
+            burst=setup.get_burst(),
+            exc_amp=setup.get_exc_amp(),
+            freq_min=setup.get_freq_min(),
+            freq_max=setup.get_freq_max(),
+            freq_steps=setup.get_freq_steps(),
+            freq_scale=setup.get_freq_scale(),
+            exc_pattern_mdl=tuple(map(tuple, setup.get_exc_pattern_mdl())),
+            exc_pattern=tuple(map(tuple, setup.get_exc_pattern())),
+            freqs=tuple(setup.get_freqs_list()),
+        )
+
+
+@dataclass(frozen=True)
+class EvtDataSciospecDevSetup(StateEventDataClass):
+    """The setup is read at creation of the event data (in the posting
+    thread), the GUI is then updated out of this snapshot"""
+
+    setup: InitVar[SciospecSetup]
+    set_freq_max_enable: bool = True
+    error: bool = False
+    snap: SetupSnapshot = field(init=False)
+
+    def __post_init__(self, setup: SciospecSetup):
+        object.__setattr__(self, "snap", SetupSnapshot.from_setup(setup))
+
+
+@bind_event(EvtDataSciospecDevSetup)
 def update_device_setup(
     ui: Ui_MainWindow,
-    setup: SciospecSetup,
+    snap: SetupSnapshot,
     set_freq_max_enable: bool = True,
     error: bool = False,
 ) -> None:
     """Actualize the inputs fields for the setup of the device coresponding to it"""
-    ui.lE_sn.setText(setup.get_sn())
-    ## Update EthernetConfig
-    ui.chB_dhcp.setChecked(bool(setup.ethernet_config.get_dhcp()))
-    ui.lE_ip.setText(setup.ethernet_config.get_ip())
-    ui.lE_mac.setText(setup.ethernet_config.get_mac())
+    # the whole window is repainted once after all inputs fields are set
+    with updates_disabled(ui.centralwidget):
+        _set_lE(ui.lE_sn, snap.sn)
+        ## Update EthernetConfig
+        _set_chB(ui.chB_dhcp, snap.dhcp)
+        _set_lE(ui.lE_ip, snap.ip)
+        _set_lE(ui.lE_mac, snap.mac)
 
-    ## Update OutputConfig Stamps
-    ui.chB_exc_stamp.setChecked(bool(setup.output_config.get_exc_stamp()))
-    ui.chB_current_stamp.setChecked(bool(setup.output_config.get_current_stamp()))
-    ui.chB_time_stamp.setChecked(bool(setup.output_config.get_time_stamp()))
+        ## Update OutputConfig Stamps
+        _set_chB(ui.chB_exc_stamp, snap.exc_stamp)
+        _set_chB(ui.chB_current_stamp, snap.current_stamp)
+        _set_chB(ui.chB_time_stamp, snap.time_stamp)
 
-    # Update Measurement Setups
-    block_signals(ui.sBd_frame_rate.setValue, setup.get_frame_rate())
-    block_signals(ui.sBd_max_frame_rate.setValue, setup.get_max_frame_rate())
-    block_signals(ui.sB_burst.setValue, setup.get_burst())
-    block_signals(ui.sBd_exc_amp.setValue, setup.get_exc_amp() * 1000)  # from A -> mA
-    block_signals(ui.sBd_freq_min.setValue, setup.get_freq_min())
-    block_signals(ui.sBd_freq_max.setValue, setup.get_freq_max())
-    block_signals(ui.sB_freq_steps.setValue, setup.get_freq_steps())
-    block_signals(ui.cB_scale.setCurrentText, setup.get_freq_scale())
+        # Update Measurement Setups
+        _set_sB(ui.sBd_frame_rate, snap.frame_rate)
+        _set_sB(ui.sBd_max_frame_rate, snap.max_frame_rate)
+        _set_sB(ui.sB_burst, snap.burst)
+        _set_sB(ui.sBd_exc_amp, snap.exc_amp * 1000)  # from A -> mA
+        _set_sB(ui.sBd_freq_min, snap.freq_min)
+        _set_sB(ui.sBd_freq_max, snap.freq_max)
+        _set_sB(ui.sB_freq_steps, snap.freq_steps)
+        set_if_changed(
+            ui.cB_scale.currentText, ui.cB_scale.setCurrentText, snap.freq_scale, True
+        )
 
-    ui.sBd_freq_max.setEnabled(set_freq_max_enable)
-    color = f"background-color: {red_light}" if error else "background-color: white"
-    ui.lab_maxF.setStyleSheet(color)
-    ui.lab_minF.setStyleSheet(color)
-    ui.lab_steps.setStyleSheet(color)
+        set_if_changed(
+            ui.sBd_freq_max.isEnabled, ui.sBd_freq_max.setEnabled, set_freq_max_enable
+        )
+        style = lab_style_error if error else lab_style_ok
+        for lab in (ui.lab_maxF, ui.lab_minF, ui.lab_steps):
+            set_if_changed(lab.styleSheet, lab.setStyleSheet, style)
 
-    set_QTableWidget(ui.tw_exc_mat_model, setup.get_exc_pattern_mdl(), 0)
-    set_QTableWidget(ui.tw_exc_mat_chip, setup.get_exc_pattern(), 0)
-    update_freqs_list(ui, setup.get_freqs_list())
+        set_QTableWidget(ui.tw_exc_mat_model, snap.exc_pattern_mdl, 0)
+        set_QTableWidget(ui.tw_exc_mat_chip, snap.exc_pattern, 0)
+        update_freqs_list(ui, snap.freqs)
 
 
-register_func_in_catalog(update_device_setup)
+def _set_lE(lE: QtWidgets.QLineEdit, val: str):
+    set_if_changed(lE.text, lE.setText, val)
 
 
-@dataclass
-class EvtDataSciospecDevSetup(EventDataClass):
-    setup: SciospecSetup
-    set_freq_max_enable: bool = True
-    error: bool = False
-    func: str = update_device_setup.__name__
+def _set_chB(chB: QtWidgets.QCheckBox, val: Any):
+    set_if_changed(chB.isChecked, chB.setChecked, bool(val))
+
+
+def _set_sB(sB: QtWidgets.QAbstractSpinBox, val: Any):
+    set_if_changed(sB.value, sB.setValue, val, True)
 
 
 # -------------------------------------------------------------------------------
@@ -312,9 +488,14 @@ class EvtDataSciospecDevSetup(EventDataClass):
 
 def update_freqs_list(ui: Ui_MainWindow, freqs: list[Any]) -> None:
 
-    freqs=[eng(f, "Hz") for f in freqs]
-    set_comboBox_items(ui.cB_eit_imaging_ref_freq, list(freqs))
-    set_comboBox_items(ui.cB_eit_imaging_meas_freq, list(freqs))
+    items = [eng(f, "Hz") for f in freqs]
+    if (
+        get_comboBox_allItemsText(ui.cB_eit_imaging_ref_freq) == items
+        and get_comboBox_allItemsText(ui.cB_eit_imaging_meas_freq) == items
+    ):
+        return
+    set_comboBox_items(ui.cB_eit_imaging_ref_freq, items)
+    set_comboBox_items(ui.cB_eit_imaging_meas_freq, items)
 
 
 # -------------------------------------------------------------------------------
@@ -351,6 +532,12 @@ class MeasuringStatus(BaseStatus):
     )
 
 
+@dataclass(frozen=True)
+class EvtDataSciospecDevMeasuringStatusChanged(StateEventDataClass):
+    meas_status: MeasuringStatus
+
+
+@bind_event(EvtDataSciospecDevMeasuringStatusChanged)
 def update_meas_status(ui: Ui_MainWindow, meas_status: MeasuringStatus) -> None:
     """Update the live measurements status label and the mesurements
     start/pause/resume button"""
@@ -361,15 +548,6 @@ def update_meas_status(ui: Ui_MainWindow, meas_status: MeasuringStatus) -> None:
     ui.pB_start_meas.setStatusTip(v.pB_status_tip)
 
 
-register_func_in_catalog(update_meas_status)
-
-
-@dataclass
-class EvtDataSciospecDevMeasuringStatusChanged(EventDataClass):
-    meas_status: MeasuringStatus
-    func: str = update_meas_status.__name__
-
-
 # -------------------------------------------------------------------------------
 ## Update live measurements state
 # -------------------------------------------------------------------------------
@@ -431,6 +609,12 @@ class CaptureStatus(BaseStatus):
     )
 
 
+@dataclass(frozen=True)
+class EvtDataCaptureStatusChanged(StateEventDataClass):
+    capture_mode: CaptureStatus
+
+
+@bind_event(EvtDataCaptureStatusChanged)
 def update_capture_status(ui: Ui_MainWindow, capture_mode: CaptureStatus) -> None:
     """Update the live measurements status label and the mesurements
     start/pause/resume button"""
@@ -444,15 +628,6 @@ def update_capture_status(ui: Ui_MainWindow, capture_mode: CaptureStatus) -> Non
         ui.pB_capture_connect.setText(v.pB_con_txt)
 
 
-register_func_in_catalog(update_capture_status)
-
-
-@dataclass
-class EvtDataCaptureStatusChanged(EventDataClass):
-    capture_mode: CaptureStatus
-    func: str = update_capture_status.__name__
-
-
 # -------------------------------------------------------------------------------
 ## Update replay status
 # -------------------------------------------------------------------------------
@@ -481,23 +656,26 @@ class ReplayStatus(BaseStatus):
     )
 
 
+@dataclass(frozen=True)
+class EvtDataReplayStatusChanged(StateEventDataClass):
+    status: ReplayStatus
+
+
+@bind_event(EvtDataReplayStatusChanged)
 def update_replay_status(ui: Ui_MainWindow, status: ReplayStatus) -> None:
     """Update the status label"""
     v: ReplayStatusUpdateData = status.value
     ui.lab_replay_status.setText(v.lab_txt)
     ui.lab_replay_status.setStyleSheet(v.lab_style)
-    icon = QtGui.QIcon()
-    icon.addPixmap(QtGui.QPixmap(v.pB_icon), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-    ui.pB_replay_play.setIcon(icon)
-
-
-register_func_in_catalog(update_replay_status)
+    ui.pB_replay_play.setIcon(_get_icon(v.pB_icon))
 
 
-@dataclass
-class EvtDataReplayStatusChanged(EventDataClass):
-    status: ReplayStatus
-    func: str = update_replay_status.__name__
+@lru_cache(maxsize=None)
+def _get_icon(path: str) -> QtGui.QIcon:
+    """Return the icon corresponding to the path (built once)"""
+    icon = QtGui.QIcon()
+    icon.addPixmap(QtGui.QPixmap(path), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+    return icon
 
 
 # -------------------------------------------------------------------------------
@@ -505,40 +683,37 @@ class EvtDataReplayStatusChanged(EventDataClass):
 # -------------------------------------------------------------------------------
 
 
-def update_imaging_inputs_fields(ui: Ui_MainWindow, imaging: EITImaging) -> None:
-    """Activate deactive the input fileddepending on the imaging type"""
-
-    meas_0 = {"show": False, "lab_text": "Ref. Frequency"}
-    meas_1 = {"show": True, "lab_text": "Meas. Frequency"}
-    ref = {"show": False, "lab_text": "Reference frame #"}
-
-    if isinstance(imaging, AbsoluteImaging):
-        pass
-    elif isinstance(imaging, TimeDifferenceImaging):
-        ref["show"] = True
-    elif isinstance(imaging, FrequenceDifferenceImaging):
-        meas_0["show"] = True
-
-    ui.cB_eit_imaging_ref_frame.setEnabled(ref["show"])
-    ui.lab_ref_frame_idx.setEnabled(ref["show"])
-    ui.lab_freq_meas_0.setText(ref["lab_text"])
+@dataclass(frozen=True)
+class EvtDataImagingInputsChanged(EventDataClass):
+    imaging: EITImaging
 
-    ui.cB_eit_imaging_ref_freq.setEnabled(meas_0["show"])
-    ui.lab_freq_meas_0.setEnabled(meas_0["show"])
-    ui.lab_freq_meas_0.setText(meas_0["lab_text"])
+    def memo_key(self) -> Any:
+        return type(self.imaging)
 
-    ui.cB_eit_imaging_meas_freq.setEnabled(meas_1["show"])
-    ui.lab_freq_meas_1.setEnabled(meas_1["show"])
-    ui.lab_freq_meas_1.setText(meas_1["lab_text"])
 
+# enable state of the inputs fields (meas_0, meas_1, ref) for each imaging type
+_IMG_TABLE = {
+    AbsoluteImaging: (False, True, False),
+    TimeDifferenceImaging: (False, True, True),
+    FrequenceDifferenceImaging: (True, True, False),
+}
+_IMG_DEFAULT = (False, True, False)
 
-register_func_in_catalog(update_imaging_inputs_fields)
 
+@bind_event(EvtDataImagingInputsChanged)
+def update_imaging_inputs_fields(ui: Ui_MainWindow, imaging: EITImaging) -> None:
+    """Activate deactive the input fileddepending on the imaging type"""
 
-@dataclass
-class EvtDataImagingInputsChanged(EventDataClass):
-    imaging: EITImaging
-    func: str = update_imaging_inputs_fields.__name__
+    show = _IMG_TABLE.get(type(imaging), _IMG_DEFAULT)
+    inputs = (
+        (ui.cB_eit_imaging_ref_freq, ui.lab_freq_meas_0, "Ref. Frequency"),
+        (ui.cB_eit_imaging_meas_freq, ui.lab_freq_meas_1, "Meas. Frequency"),
+        (ui.cB_eit_imaging_ref_frame, ui.lab_ref_frame_idx, "Reference frame #"),
+    )
+    for (cB, lab, lab_text), enable in zip(inputs, show):
+        set_if_changed(cB.isEnabled, cB.setEnabled, enable)
+        set_if_changed(lab.isEnabled, lab.setEnabled, enable)
+        set_if_changed(lab.text, lab.setText, lab_text)
 
 
 # -------------------------------------------------------------------------------
@@ -546,6 +721,12 @@ class EvtDataImagingInputsChanged(EventDataClass):
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtDataEITDataPlotOptionsChanged(EventDataClass):
+    pass
+
+
+@bind_event(EvtDataEITDataPlotOptionsChanged)
 def update_EITData_plots_options(ui: Ui_MainWindow) -> None:
     """Activate/deactivate checkbox for EITData plots"""
     # ui.rB_UPlot.setEnabled(ui.chB_eit_data_monitoring.isChecked())
@@ -554,19 +735,25 @@ def update_EITData_plots_options(ui: Ui_MainWindow) -> None:
     # ui.rB_monitoring.setEnabled(ui.chB_eit_data_monitoring.isChecked())
 
 
-register_func_in_catalog(update_EITData_plots_options)
+# -------------------------------------------------------------------------------
+## Update frame aquisition progress
+# -------------------------------------------------------------------------------
 
 
-@dataclass
-class EvtDataEITDataPlotOptionsChanged(EventDataClass):
-    func: str = update_EITData_plots_options.__name__
+@dataclass(frozen=True)
+class EvtDataNewFrameProgress(EventDataClass):
+    """Set idx_frame to `None` to NOT update it"""
 
+    idx_frame: int = 0
+    progression: int = 0
 
-# -------------------------------------------------------------------------------
-## Update frame aquisition progress
-# -------------------------------------------------------------------------------
+    def coalesce_key(self) -> Any:
+        # events not updating the idx_frame can not replace the others
+        return self.idx_frame is None
 
 
+@bind_event(EvtDataNewFrameProgress)
+@throttle(1 / 30, let_pass=lambda progression=0, **_: progression in (0, 100))
 def update_progress_acquired_frame(
     ui: Ui_MainWindow, idx_frame: int = 0, progression: int = 0
 ) -> None:
@@ -580,36 +767,31 @@ def update_progress_acquired_frame(
     # logger.debug("update_progress_acquired_frame-ou")
 
 
-register_func_in_catalog(update_progress_acquired_frame)
-
-
-@dataclass
-class EvtDataNewFrameProgress(EventDataClass):
-    """Set idx_frame to `None` to NOT update it"""
-
-    idx_frame: int = 0
-    progression: int = 0
-    func: str = update_progress_acquired_frame.__name__
-
-
 # -------------------------------------------------------------------------------
 ## Update frame info text (during acquisition and replay)
 # -------------------------------------------------------------------------------
 
 
-def update_frame_info(ui: Ui_MainWindow, info: str = "") -> None:
-    if info is not None:
-        text= "\r\n".join(info).replace(': ', ':\t')
-        ui.tE_frame_info.setText(text)
+@dataclass(frozen=True)
+class EvtDataNewFrameInfo(StateEventDataClass):
+    """info are the lines of the text to display (can be also a single str)"""
 
+    info: Union[list[str], str] = ""
 
-register_func_in_catalog(update_frame_info)
 
+_CRLF_JOIN = "\r\n".join
 
-@dataclass
-class EvtDataNewFrameInfo(EventDataClass):
-    info: str = ""
-    func: str = update_frame_info.__name__
+
+@bind_event(EvtDataNewFrameInfo)
+def update_frame_info(ui: Ui_MainWindow, info: Union[list[str], str] = "") -> None:
+    if info is None:
+        return
+    # a str is displayed as it is (joining it would split it char by char)
+    text = info if isinstance(info, str) else _CRLF_JOIN(info)
+    text = text.replace(": ", ":\t")
+    # QTextEdit returns the plain text with "\n" as line separator
+    if ui.tE_frame_info.toPlainText() != text.replace("\r\n", "\n"):
+        ui.tE_frame_info.setText(text)
 
 
 # -------------------------------------------------------------------------------
@@ -617,6 +799,14 @@ class EvtDataNewFrameInfo(EventDataClass):
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtDataAutosaveOptionsChanged(EventDataClass):
+    autosave: bool
+    save_img: bool
+    load_after_meas: bool
+
+
+@bind_event(EvtDataAutosaveOptionsChanged)
 def update_autosave_options(
     ui: Ui_MainWindow, autosave: bool, save_img: bool, load_after_meas: bool
 ) -> None:
@@ -636,42 +826,40 @@ def update_autosave_options(
     # )
 
 
-register_func_in_catalog(update_autosave_options)
-
-
-@dataclass
-class EvtDataAutosaveOptionsChanged(EventDataClass):
-    autosave: bool
-    save_img: bool
-    load_after_meas: bool
-    func: str = update_autosave_options.__name__
-
-
 # -------------------------------------------------------------------------------
 ## Update dataset loaded
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtDataMeasDatasetLoaded(EventDataClass):
+    dataset_dir: str
+    nb_loaded_frame: int
+    frames: list[str] = field(init=False)
+
+    def __post_init__(self):
+        # the items of the frame comboBoxes are rendered here, in the thread
+        # posting the event, and not in the GUI thread
+        object.__setattr__(self, "frames", list(_range_list(self.nb_loaded_frame)))
+
+
+@bind_event(EvtDataMeasDatasetLoaded)
 def update_dataset_loaded(
-    ui: Ui_MainWindow, dataset_dir: str, nb_loaded_frame: int
+    ui: Ui_MainWindow, dataset_dir: str, nb_loaded_frame: int, frames: list[str]
 ) -> None:
     """
     Update infos afer dataset has been loaded, dataset directory,init comboBox
     and slider for frame selection"""
     ui.tE_load_dataset_dir.setText(dataset_dir)
-    set_comboBox_items(ui.cB_replay_frame_idx, list(range(nb_loaded_frame)))
-    set_comboBox_items(ui.cB_eit_imaging_ref_frame, list(range(nb_loaded_frame)))
+    set_comboBox_strings(ui.cB_replay_frame_idx, frames)
+    set_comboBox_strings(ui.cB_eit_imaging_ref_frame, frames)
     set_QSlider_scale(ui.slider_replay, nb_pos=nb_loaded_frame)
 
 
-register_func_in_catalog(update_dataset_loaded)
-
-
-@dataclass
-class EvtDataMeasDatasetLoaded(EventDataClass):
-    dataset_dir: str
-    nb_loaded_frame: int
-    func: str = update_dataset_loaded.__name__
+@lru_cache(maxsize=8)
+def _range_list(n: int) -> tuple[str]:
+    """Return the items for frame indexes comboBoxes (reused on same `n`)"""
+    return tuple(str(i) for i in range(n))
 
 
 # -------------------------------------------------------------------------------
@@ -679,6 +867,12 @@ class EvtDataMeasDatasetLoaded(EventDataClass):
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtDataReplayFrameChanged(EventDataClass):
+    idx: int
+
+
+@bind_event(EvtDataReplayFrameChanged)
 def update_replay_frame_changed(ui: Ui_MainWindow, idx: int) -> None:
     """
     Update the index of the actula frame in combo box and in silder
@@ -687,20 +881,18 @@ def update_replay_frame_changed(ui: Ui_MainWindow, idx: int) -> None:
     set_QSlider_position(ui.slider_replay, pos=idx)
 
 
-register_func_in_catalog(update_replay_frame_changed)
-
-
-@dataclass
-class EvtDataReplayFrameChanged(EventDataClass):
-    idx: int
-    func: str = update_replay_frame_changed.__name__
-
-
 # -------------------------------------------------------------------------------
 ## Update captured image
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtDataCaptureImageChanged(StateEventDataClass):
+    image: QtGui.QImage
+    image_path: str = ""
+
+
+@bind_event(EvtDataCaptureImageChanged)
 def update_captured_image(
     ui: Ui_MainWindow, image: QtGui.QImage, image_path: str
 ) -> None:
@@ -718,33 +910,20 @@ def update_captured_image(
     ui.lE_path_video_frame.setText(image_path)
 
 
-register_func_in_catalog(update_captured_image)
-
-
-@dataclass
-class EvtDataCaptureImageChanged(EventDataClass):
-    image: QtGui.QImage
-    image_path: str = ""
-    func: str = update_captured_image.__name__
-
-
 # -------------------------------------------------------------------------------
 ## Update eit model loaded (during acquisition and replay)
 # -------------------------------------------------------------------------------
 
 
-def update_eit_model_loaded(ui: Ui_MainWindow, name: str = "") -> None:
-
-    ui.lE_eit_model_name.setText(name)
-
+@dataclass(frozen=True)
+class EvtEitModelLoaded(EventDataClass):
+    name: str = ""
 
-register_func_in_catalog(update_eit_model_loaded)
 
+@bind_event(EvtEitModelLoaded)
+def update_eit_model_loaded(ui: Ui_MainWindow, name: str = "") -> None:
 
-@dataclass
-class EvtEitModelLoaded(EventDataClass):
-    name: str = ""
-    func: str = update_eit_model_loaded.__name__
+    ui.lE_eit_model_name.setText(name)
 
 
 # -------------------------------------------------------------------------------
@@ -752,6 +931,12 @@ class EvtEitModelLoaded(EventDataClass):
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtGlobalDirectoriesSet(EventDataClass):
+    pass
+
+
+@bind_event(EvtGlobalDirectoriesSet)
 def update_global_directories(ui: Ui_MainWindow) -> None:
 
     ui.lE_measdataset_gdir.setText(get_dir(AppStdDir.meas_set))
@@ -761,19 +946,17 @@ def update_global_directories(ui: Ui_MainWindow) -> None:
     ui.lE_chip_ctlg_gdir.setText(get_dir(AppStdDir.chips))
 
 
-register_func_in_catalog(update_global_directories)
-
-
-@dataclass
-class EvtGlobalDirectoriesSet(EventDataClass):
-    func: str = update_global_directories.__name__
-
-
 # -------------------------------------------------------------------------------
 ## Update reconstruction parameters
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtRecSolverChanged(EventDataClass):
+    preset: PyEitRecParams
+
+
+@bind_event(EvtRecSolverChanged)
 def update_reconstruction_parameters(ui: Ui_MainWindow, preset: PyEitRecParams) -> None:
 
     _set_cB_rec_params(ui.cB_pyeit_reg_method, preset.method)
@@ -805,20 +988,25 @@ def _set_sBd_rec_params(sBd: QtWidgets.QDoubleSpinBox, val: Any):
     else:
         sBd.setEnabled(False)
 
-
-register_func_in_catalog(update_reconstruction_parameters)
-
-
-@dataclass
-class EvtRecSolverChanged(EventDataClass):
-    preset: PyEitRecParams
-    func: str = update_reconstruction_parameters.__name__
-
 # -------------------------------------------------------------------------------
 ## Pop msg box
 # -------------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class EvtPopMsgBox(EventDataClass):
+    """
+    _summary_
+
+    Args:
+        msgbox_type:str='info', 'warn', 'error'
+    """
+    title:str
+    msg:str
+    msgbox_type:str='info'
+
+
+@bind_event(EvtPopMsgBox)
 def update_pop_msg(ui: Ui_MainWindow,title:str, msg:str,msgbox_type:str) -> None:
     msgbox_type=msgbox_type.lower()
     
@@ -832,22 +1020,6 @@ def update_pop_msg(ui: Ui_MainWindow,title:str, msg:str,msgbox_type:str) -> None
     else:
         return
 
-register_func_in_catalog(update_pop_msg)
-
-
-@dataclass
-class EvtPopMsgBox(EventDataClass):
-    """
-    _summary_
-
-    Args:
-        msgbox_type:str='info', 'warn', 'error'
-    """
-    title:str
-    msg:str
-    msgbox_type:str='info'
-    func: str = update_pop_msg.__name__
-
 if __name__ == "__main__":
     """"""
     a = EvtDataSciospecDevices("")
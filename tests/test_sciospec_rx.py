@@ -0,0 +1,67 @@
+import struct
+import unittest
+
+from eit_app.sciospec.constants import slice_rx_frames
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+ACK = bytes([0x18, 0x01, 0x83, 0x18])
+DEVICE_INFOS = bytes([0xD1, 0x07, 1, 2, 3, 4, 5, 6, 7, 0xD1])
+
+
+class TestSliceRxFrames(unittest.TestCase):
+    def test_several_frames_in_one_read(self):
+        buf = bytearray(ACK + DEVICE_INFOS + ACK)
+        self.assertEqual(slice_rx_frames(buf), [ACK, DEVICE_INFOS, ACK])
+        self.assertEqual(buf, bytearray())
+
+    def test_frame_split_across_two_reads(self):
+        buf = bytearray(ACK + DEVICE_INFOS[:6])
+        self.assertEqual(slice_rx_frames(buf), [ACK])
+        self.assertEqual(buf, bytearray(DEVICE_INFOS[:6]))
+
+        buf.extend(DEVICE_INFOS[6:])
+        self.assertEqual(slice_rx_frames(buf), [DEVICE_INFOS])
+        self.assertEqual(buf, bytearray())
+
+    def test_trailing_partial_header(self):
+        buf = bytearray(ACK + DEVICE_INFOS[:3])
+        self.assertEqual(slice_rx_frames(buf), [ACK])
+        self.assertEqual(buf, bytearray(DEVICE_INFOS[:3]))
+
+        buf.extend(DEVICE_INFOS[3:])
+        self.assertEqual(slice_rx_frames(buf), [DEVICE_INFOS])
+        self.assertEqual(buf, bytearray())
+
+    def test_empty_buffer(self):
+        buf = bytearray()
+        self.assertEqual(slice_rx_frames(buf), [])
+        self.assertEqual(buf, bytearray())
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestConvertMeasData(unittest.TestCase):
+    def test_same_as_struct_decoding(self):
+        from eit_app.sciospec.utils import convert_meas_data
+
+        values = [1.0, -2.5, 3.25e-3, 0.0, -7.5e4, 1.5]
+        meas_data = list(struct.pack(">6f", *values))
+
+        # previous decoding: 4 bytes per single float, (real, imag) pairs
+        meas_f = [
+            struct.unpack(">f", bytes(meas_data[i : i + 4]))[0]
+            for i in range(0, len(meas_data), 4)
+        ]
+        expected = np.array(meas_f[0::2]) + 1j * np.array(meas_f[1::2])
+
+        voltage = convert_meas_data(meas_data)
+        self.assertEqual(voltage.dtype, np.complex128)
+        np.testing.assert_array_equal(voltage, expected)
+        np.testing.assert_array_equal(convert_meas_data(bytes(meas_data)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+try:
+    from eit_app.sciospec.setup import SciospecSetup
+except ImportError:  # pragma: no cover
+    SciospecSetup = None
+
+
+@unittest.skipIf(SciospecSetup is None, "numpy or glob_utils is not installed")
+class TestExcPatternsData(unittest.TestCase):
+    def setUp(self):
+        self.setup = SciospecSetup(32)
+
+    def test_same_as_list_per_pattern(self):
+        self.setup.exc_pattern = [[1, 2], [3, 4], [31, 32]]
+        self.assertEqual(
+            self.setup.get_exc_patterns_data(),
+            [bytes([1, 2]), bytes([3, 4]), bytes([31, 32])],
+        )
+
+    def test_patterns_of_different_lengths(self):
+        self.setup.exc_pattern = [[1, 2], [3], [4, 5, 6]]
+        self.assertEqual(
+            self.setup.get_exc_patterns_data(),
+            [bytes([1, 2]), bytes([3]), bytes([4, 5, 6])],
+        )
+
+    def test_empty_pattern_sent_as_null_byte(self):
+        self.setup.exc_pattern = [[1, 2], []]
+        self.assertEqual(
+            self.setup.get_exc_patterns_data(), [bytes([1, 2]), bytes([0x00])]
+        )
+
+    def test_out_of_range_values(self):
+        for pattern in ([1, 256], [-1, 2]):
+            self.setup.exc_pattern = [pattern]
+            with self.assertRaises(ValueError):
+                self.setup.get_exc_patterns_data()
+
+
+if __name__ == "__main__":
+    unittest.main()